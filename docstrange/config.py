@@ -1,5 +1,8 @@
 # docstrange/config.py
 
+import os
+
+
 class InternalConfig:
     # Internal feature flags and defaults (not exposed to end users)
     use_markdownify = True
@@ -9,6 +12,24 @@ class InternalConfig:
     pdf_to_image_enabled = True  # Convert PDF pages to images for OCR
     pdf_image_dpi = 300  # DPI for PDF to image conversion
     pdf_image_scale = 2.0  # Scale factor for better OCR accuracy
+    pdf_image_max_side = 2048  # Upper bound in pixels on the longer side of a rendered page
+    ocr_batch_size = 4  # Pages per model call when the OCR service supports batching
+    
+    # Set DOCSTRANGE_LAYOUT_OCR=0 to skip layout detection and only run plain-text OCR
+    layout_ocr_enabled = os.environ.get('DOCSTRANGE_LAYOUT_OCR', '1') == '1'
+    
+    # Cloud API response cache (persisted across runs, keyed by file content hash).
+    # Off by default since it stores extracted document content on disk;
+    # set DOCSTRANGE_CLOUD_CACHE=1 or pass cache_enabled=True to opt in.
+    cloud_cache_enabled = os.environ.get('DOCSTRANGE_CLOUD_CACHE', '0') == '1'
+    cloud_cache_dir = os.environ.get(
+        'DOCSTRANGE_CLOUD_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'docstrange', 'cloud')
+    )
+    cloud_cache_ttl = 7 * 24 * 3600  # Seconds before a cached response is refetched
+    
+    # CSV files larger than this (bytes) are streamed in chunks of csv_chunk_rows rows
+    csv_chunk_threshold = 200 * 1024 * 1024
+    csv_chunk_rows = 50_000
     
     # Add other internal config options here as needed
     # e.g. default_ocr_lang = 'en'
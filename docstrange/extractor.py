@@ -16,6 +16,7 @@ from .processors import (
     CloudProcessor,
     GPUProcessor,
 )
+from .config import InternalConfig
 from .result import ConversionResult
 from .exceptions import ConversionError, UnsupportedFormatError, FileNotFoundError
 from .utils.gpu_utils import should_use_gpu_processor
@@ -35,7 +36,10 @@ class DocumentExtractor:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         cpu: bool = False,
-        gpu: bool = False
+        gpu: bool = False,
+        cloud_cache_enabled: Optional[bool] = None,
+        cloud_cache_dir: Optional[str] = None,
+        use_markdownify: Optional[bool] = None
     ):
         """Initialize the file extractor.
         
@@ -47,6 +51,11 @@ class DocumentExtractor:
             model: Model to use for cloud processing (gemini, openapi) - only for cloud mode
             cpu: Force local CPU-only processing (disables cloud mode)
             gpu: Force local GPU processing (disables cloud mode, requires GPU)
+            cloud_cache_enabled: Cache cloud API responses on disk and reuse them for identical files - only for
+                cloud mode. Off by default (or DOCSTRANGE_CLOUD_CACHE=1); entries hold extracted document content
+            cloud_cache_dir: Directory for cached cloud responses (default ~/.cache/docstrange/cloud)
+            use_markdownify: Convert local HTML files with markdownify (default from InternalConfig); pass False
+                to use the faster html2text converter when it is installed
         
         Note:
             - Local mode (GPU/CPU) is the default for privacy and offline processing
@@ -60,6 +69,9 @@ class DocumentExtractor:
         self.model = model
         self.cpu = cpu
         self.gpu = gpu
+        self.cloud_cache_enabled = cloud_cache_enabled
+        self.cloud_cache_dir = cloud_cache_dir
+        self.use_markdownify = InternalConfig.use_markdownify if use_markdownify is None else use_markdownify
         
         # Determine processing mode
         # Default to local processing (GPU if available, otherwise CPU)
@@ -112,6 +124,8 @@ class DocumentExtractor:
         
         # Initialize processors
         self.processors = []
+        # Processor chosen per file extension, filled lazily by _get_processor
+        self._processor_cache = {}
         
         if self.cloud_mode:
             # Cloud mode setup
@@ -119,7 +133,9 @@ class DocumentExtractor:
                 api_key=self.api_key,  # Can be None for rate-limited access
                 model_type=self.model,
                 preserve_layout=preserve_layout,
-                include_images=include_images
+                include_images=include_images,
+                cache_enabled=self.cloud_cache_enabled,
+                cache_dir=self.cloud_cache_dir
             )
             self.processors.append(cloud_processor)
             
@@ -175,7 +191,7 @@ class DocumentExtractor:
             DOCXProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images),
             TXTProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images),
             ExcelProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images),
-            HTMLProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images),
+            HTMLProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images, use_markdownify=self.use_markdownify),
             PPTXProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images),
             ImageProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images, ocr_enabled=self.ocr_enabled),
             URLProcessor(preserve_layout=self.preserve_layout, include_images=self.include_images),
@@ -249,7 +265,9 @@ class DocumentExtractor:
                 output_type=output_type,
                 model_type=self.model,   # Pass model as model_type
                 preserve_layout=self.preserve_layout,
-                include_images=self.include_images
+                include_images=self.include_images,
+                cache_enabled=self.cloud_cache_enabled,
+                cache_dir=self.cloud_cache_dir
             )
             if cloud_processor.can_process(file_path):
                 logger.info(f"Using cloud processor with output_type={output_type} for {file_path}")
@@ -339,15 +357,30 @@ class DocumentExtractor:
         Args:
             file_path: Path to the file
             
+        Returns:
+            Processor that can handle the file, or None if none found
+        """
+        # Check file extension
+        ext = os.path.splitext(file_path)[1].lower()
+        
+        # The choice depends only on the extension once the file is known to exist
+        if ext not in self._processor_cache:
+            self._processor_cache[ext] = self._select_processor(file_path, ext)
+        return self._processor_cache[ext]
+    
+    def _select_processor(self, file_path: str, ext: str):
+        """Pick the processor for a file extension by probing each processor.
+        
+        Args:
+            file_path: Path to the file
+            ext: Lower-cased file extension, including the dot
+            
         Returns:
             Processor that can handle the file, or None if none found
         """
         # Define GPU-supported formats
         gpu_supported_formats = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif', '.pdf']
         
-        # Check file extension
-        _, ext = os.path.splitext(file_path.lower())
-        
         # Check if GPU processor should be used for this file type
         gpu_available = should_use_gpu_processor()
         
@@ -3,14 +3,32 @@
 import re
 import logging
 from typing import List, Dict, Tuple
-import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Characters OCR commonly confuses: '|' -> 'I', and '0'/'1' -> 'o'/'l' in certain contexts
+_OCR_CONFUSIONS = str.maketrans({'|': 'I', '0': 'o', '1': 'l'})
+
+# Text clean-up patterns, compiled once for every OCR block
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_SPACING_RE = re.compile(r'([.!?])\s*([A-Z])')
+_OCR_ARTIFACT_RE = re.compile(r'[^\w\s.,!?;:()[\]{}"\'-]')
+_COLUMN_GAP_RE = re.compile(r'\s{2,}')
+
+# Numbered, bulleted, markdown and lettered list markers at the start of a line.
+# Apart from bullet glyphs they must be followed by whitespace, so "3.5 million",
+# "-5 degrees" and "e.g." stay plain text.
+_LIST_ITEM_RE = re.compile(r'^(?:[•·▪▫◦‣⁃]\s*|(?:\d+\.|[-*+]|[a-zA-Z]\.)\s+)')
+
+# Bullet markers replaced by the markdown bullet; numbers and letters are kept as text
+_BULLET_RE = re.compile(r'^(?:[•·▪▫◦‣⁃]\s*|[-*+]\s+)')
+
 
 class LayoutElement:
     """Represents a layout element with position and content."""
     
+    __slots__ = ('text', 'x', 'y', 'width', 'height', 'element_type', 'confidence', 'bbox')
+    
     def __init__(self, text: str, x: int, y: int, width: int, height: int, 
                  element_type: str = "text", confidence: float = 0.0):
         self.text = text
@@ -44,12 +62,6 @@ class LayoutDetector:
         self._header_threshold = 0.15  # Top 15% of page considered header area
         self._footer_threshold = 0.85  # Bottom 15% of page considered footer area
         self._heading_height_threshold = 1.5  # Relative height for heading detection
-        self._list_patterns = [
-            r'^\d+\.',  # Numbered list
-            r'^[•·▪▫◦‣⁃]',  # Bullet points
-            r'^[-*+]',  # Markdown list markers
-            r'^[a-zA-Z]\.',  # Lettered list
-        ]
     
     def convert_to_structured_markdown(self, text_blocks: List[LayoutElement], image_size: Tuple[int, int]) -> str:
         """Convert text blocks to structured markdown with proper hierarchy."""
@@ -74,7 +86,9 @@ class LayoutDetector:
                     level = self._determine_heading_level_from_text(paragraph)
                     markdown_parts.append(f"{'#' * level} {paragraph}")
                 elif paragraph_type == "list_item":
-                    markdown_parts.append(f"- {paragraph}")
+                    # Replace an OCR'd bullet with the markdown one
+                    item = _BULLET_RE.sub('', paragraph.strip(), count=1) or paragraph
+                    markdown_parts.append(f"- {item}")
                 elif paragraph_type == "table_row":
                     markdown_parts.append(self._format_table_row(paragraph))
                 else:
@@ -89,7 +103,7 @@ class LayoutDetector:
         
         # Calculate average text height for relative sizing
         heights = [block.height for block in text_blocks]
-        avg_height = np.mean(heights) if heights else 20
+        avg_height = sum(heights) / len(heights) if heights else 20
         
         # Group by proximity and text characteristics
         paragraphs = []
@@ -171,17 +185,15 @@ class LayoutDetector:
     
     def _post_process_text(self, text: str) -> str:
         """Post-process text to improve readability."""
-        # Fix common OCR issues
-        text = text.replace('|', 'I')  # Common OCR mistake
-        text = text.replace('0', 'o')  # Common OCR mistake in certain contexts
-        text = text.replace('1', 'l')  # Common OCR mistake in certain contexts
+        # Fix common OCR issues in a single pass
+        text = text.translate(_OCR_CONFUSIONS)
         
         # Fix spacing issues
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single space
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)  # Fix sentence spacing
+        text = _WHITESPACE_RE.sub(' ', text)  # Multiple spaces to single space
+        text = _SENTENCE_SPACING_RE.sub(r'\1 \2', text)  # Fix sentence spacing
         
         # Fix common OCR artifacts
-        text = re.sub(r'[^\w\s.,!?;:()[\]{}"\'-]', '', text)  # Remove strange characters
+        text = _OCR_ARTIFACT_RE.sub('', text)  # Remove strange characters
         
         return text
     
@@ -218,10 +230,7 @@ class LayoutDetector:
     def _is_list_item(self, text: str) -> bool:
         """Check if text is a list item."""
         text = text.strip()
-        for pattern in self._list_patterns:
-            if re.match(pattern, text):
-                return True
-        return False
+        return _LIST_ITEM_RE.match(text) is not None
     
     def _is_table_row(self, text: str) -> bool:
         """Check if text might be a table row."""
@@ -247,7 +256,7 @@ class LayoutDetector:
             cells = [cell.strip() for cell in text.split('\t')]
         else:
             # Try to split by multiple spaces
-            cells = [cell.strip() for cell in re.split(r'\s{2,}', text)]
+            cells = [cell.strip() for cell in _COLUMN_GAP_RE.split(text)]
         
         # Format as markdown table row
         return '| ' + ' | '.join(cells) + ' |'
@@ -324,5 +333,5 @@ class LayoutDetector:
             width=max_x - min_x,
             height=max_y - min_y,
             element_type="text",
-            confidence=np.mean(confidences) if confidences else 0.0
+            confidence=sum(confidences) / len(confidences) if confidences else 0.0
         ) 
\ No newline at end of file
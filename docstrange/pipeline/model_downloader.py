@@ -56,6 +56,9 @@ class ModelDownloader:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Resolved model paths (None for missing models), cleared on download
+        self._path_cache = {}
+        
         logger.info(f"Model cache directory: {self.cache_dir}")
     
     def download_models(self, force: bool = False, progress: bool = True) -> Path:
@@ -69,6 +72,7 @@ class ModelDownloader:
             Path to the models directory
         """
         logger.info("Downloading pre-trained models...")
+        self._path_cache.clear()
         
         # Auto-detect GPU for Nanonets model
         gpu_available = is_gpu_available()
@@ -221,13 +225,17 @@ class ModelDownloader:
             logger.error(f"Unknown model type: {model_type}")
             return None
         
+        if model_type in self._path_cache:
+            return self._path_cache[model_type]
+        
         model_path = self.cache_dir / model_mapping[model_type]
         
         if not model_path.exists():
             logger.warning(f"Model {model_type} not found at {model_path}")
-            return None
+            model_path = None
         
-        return model_path 
+        self._path_cache[model_type] = model_path
+        return model_path
 
     def are_models_cached(self) -> bool:
         """Check if all required models are cached.
@@ -2,12 +2,31 @@
 
 import logging
 import os
-from typing import Optional
+from typing import List, Optional, Union
 from pathlib import Path
 from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+_OCR_PROMPT = """Extract the text from the above document as if you were reading it naturally. Return the tables in html format. Return the equations in LaTeX representation. If there is an image in the document and image caption is not present, add a small description of the image inside the <img></img> tag; otherwise, add the image caption inside <img></img>. Watermarks should be wrapped in brackets. Ex: <watermark>OFFICIAL COPY</watermark>. Page numbers should be wrapped in brackets. Ex: <page_number>14</page_number> or <page_number>9/22</page_number>. Prefer using ☐ and ☑ for check boxes."""
+
+
+def _inference_dtype():
+    """Pick the half-precision dtype to load the OCR model in.
+    
+    Returns:
+        torch.bfloat16 on GPUs that support it, torch.float16 on other GPUs,
+        and "auto" (the checkpoint's own dtype) on CPU.
+    """
+    try:
+        import torch
+    except ImportError:
+        return "auto"
+    
+    if torch.cuda.is_available():
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return "auto"
+
 
 class NanonetsDocumentProcessor:
     """Neural Document Processor using Nanonets OCR model."""
@@ -52,7 +71,7 @@ class NanonetsDocumentProcessor:
             # Load model from local path
             self.model = AutoModelForImageTextToText.from_pretrained(
                 str(actual_model_path), 
-                torch_dtype="auto", 
+                torch_dtype=_inference_dtype(), 
                 device_map="auto", 
                 local_files_only=True  # Use only local files
             )
@@ -79,10 +98,10 @@ class NanonetsDocumentProcessor:
             logger.error(f"Failed to initialize Nanonets OCR model: {e}")
             raise
     
-    def extract_text(self, image_path: str) -> str:
-        """Extract text from image using Nanonets OCR."""
+    def extract_text(self, image_path: Union[str, Image.Image]) -> str:
+        """Extract text from an image path or an already decoded PIL image using Nanonets OCR."""
         try:
-            if not os.path.exists(image_path):
+            if isinstance(image_path, str) and not os.path.exists(image_path):
                 logger.error(f"Image file does not exist: {image_path}")
                 return ""
             
@@ -92,7 +111,7 @@ class NanonetsDocumentProcessor:
             logger.error(f"Nanonets OCR extraction failed: {e}")
             return ""
     
-    def extract_text_with_layout(self, image_path: str) -> str:
+    def extract_text_with_layout(self, image_path: Union[str, Image.Image]) -> str:
         """Extract text with layout awareness using Nanonets OCR.
         
         Note: Nanonets OCR already provides layout-aware extraction,
@@ -100,26 +119,49 @@ class NanonetsDocumentProcessor:
         """
         return self.extract_text(image_path)
     
-    def _extract_text_with_nanonets(self, image_path: str, max_new_tokens: int = 4096) -> str:
+    def extract_text_batch(self, image_paths: List[str], batch_size: int = 4) -> List[str]:
+        """Extract text from several images, running the model on batches of pages.
+        
+        Args:
+            image_paths: Paths to the image files
+            batch_size: Number of images passed to the model per generate call
+            
+        Returns:
+            Extracted text for each image, in input order
+        """
+        results = []
+        for start in range(0, len(image_paths), batch_size):
+            batch = image_paths[start:start + batch_size]
+            try:
+                results.extend(self._extract_text_batch_with_nanonets(batch))
+            except Exception as e:
+                logger.warning(f"Batched Nanonets OCR failed, retrying pages one at a time: {e}")
+                results.extend(self.extract_text(image_path) for image_path in batch)
+        return results
+    
+    def _build_prompt(self) -> str:
+        """Build the chat-formatted OCR prompt for a single image."""
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": [
+                {"type": "image"},
+                {"type": "text", "text": _OCR_PROMPT},
+            ]},
+        ]
+        return self.processor.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+    
+    def _extract_text_with_nanonets(self, image_path: Union[str, Image.Image], max_new_tokens: int = 4096) -> str:
         """Extract text using Nanonets OCR model."""
         try:
-            prompt = """Extract the text from the above document as if you were reading it naturally. Return the tables in html format. Return the equations in LaTeX representation. If there is an image in the document and image caption is not present, add a small description of the image inside the <img></img> tag; otherwise, add the image caption inside <img></img>. Watermarks should be wrapped in brackets. Ex: <watermark>OFFICIAL COPY</watermark>. Page numbers should be wrapped in brackets. Ex: <page_number>14</page_number> or <page_number>9/22</page_number>. Prefer using ☐ and ☑ for check boxes."""
-            
-            image = Image.open(image_path)
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": [
-                    {"type": "image", "image": f"file://{image_path}"},
-                    {"type": "text", "text": prompt},
-                ]},
-            ]
-            
-            text = self.processor.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+            # Callers that already decoded the image pass it straight through
+            image = image_path if isinstance(image_path, Image.Image) else Image.open(image_path)
+            
+            text = self._build_prompt()
             inputs = self.processor(text=[text], images=[image], padding=True, return_tensors="pt")
             inputs = inputs.to(self.model.device)
             
             output_ids = self.model.generate(**inputs, max_new_tokens=max_new_tokens, do_sample=False)
-            generated_ids = [output_ids[len(input_ids):] for input_ids, output_ids in zip(inputs.input_ids, output_ids)]
+            generated_ids = output_ids[:, inputs.input_ids.shape[1]:]
             
             output_text = self.processor.batch_decode(generated_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True)
             return output_text[0]
@@ -128,6 +170,37 @@ class NanonetsDocumentProcessor:
             logger.error(f"Nanonets OCR extraction failed: {e}")
             return ""
     
+    def _extract_text_batch_with_nanonets(self, image_paths: List[Union[str, Image.Image]], max_new_tokens: int = 4096) -> List[str]:
+        """Extract text from a batch of images in a single generate call."""
+        tokenizer = self.processor.tokenizer
+        padding_side = tokenizer.padding_side
+        opened = []  # Images loaded here from paths, closed once the batch is done
+        try:
+            images = []
+            for image_path in image_paths:
+                if isinstance(image_path, Image.Image):
+                    images.append(image_path)
+                else:
+                    image = Image.open(image_path)
+                    opened.append(image)
+                    images.append(image)
+            
+            text = self._build_prompt()
+            # Pad on the left so every prompt in the batch ends where generation starts
+            tokenizer.padding_side = "left"
+            inputs = self.processor(text=[text] * len(images), images=images, padding=True, return_tensors="pt")
+            inputs = inputs.to(self.model.device)
+            
+            output_ids = self.model.generate(**inputs, max_new_tokens=max_new_tokens, do_sample=False)
+            generated_ids = output_ids[:, inputs.input_ids.shape[1]:]
+            
+            return self.processor.batch_decode(generated_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+        finally:
+            # The processor is shared, so leave its tokenizer as we found it
+            tokenizer.padding_side = padding_side
+            for image in opened:
+                image.close()
+    
     def __del__(self):
         """Cleanup resources."""
         pass 
\ No newline at end of file
@@ -1,10 +1,12 @@
 """Neural Document Processor using docling's pre-trained models for superior document understanding."""
 
+import io
 import logging
 import os
 import platform
 import sys
-from typing import Optional, List, Dict, Any, Tuple
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, Tuple, Union
 from pathlib import Path
 from PIL import Image
 import numpy as np
@@ -53,11 +55,16 @@ def _check_numpy_version():
         return True
 
 from .model_downloader import ModelDownloader
-from .layout_detector import LayoutDetector
+from .layout_detector import LayoutDetector, LayoutElement
 
 logger = logging.getLogger(__name__)
 
 
+def _join_confident_text(results) -> str:
+    """Join the text of EasyOCR detections above the confidence cut-off."""
+    return ' '.join(text for _, text, confidence in results if confidence > 0.5)
+
+
 class NeuralDocumentProcessor:
     """Neural Document Processor using docling's pre-trained models."""
     
@@ -261,10 +268,10 @@ class NeuralDocumentProcessor:
                 logger.error(f"Failed to initialize docling models: {e}")
             raise
     
-    def extract_text(self, image_path: str) -> str:
-        """Extract text from image using neural OCR."""
+    def extract_text(self, image_path: Union[str, Image.Image]) -> str:
+        """Extract text from an image path or an already decoded PIL image using neural OCR."""
         try:
-            if not os.path.exists(image_path):
+            if isinstance(image_path, str) and not os.path.exists(image_path):
                 logger.error(f"Image file does not exist: {image_path}")
                 return ""
             
@@ -274,10 +281,10 @@ class NeuralDocumentProcessor:
             logger.error(f"OCR extraction failed: {e}")
             return ""
     
-    def extract_text_with_layout(self, image_path: str) -> str:
+    def extract_text_with_layout(self, image_path: Union[str, Image.Image]) -> str:
         """Extract text with layout awareness using neural models."""
         try:
-            if not os.path.exists(image_path):
+            if isinstance(image_path, str) and not os.path.exists(image_path):
                 logger.error(f"Image file does not exist: {image_path}")
                 return ""
             
@@ -287,114 +294,156 @@ class NeuralDocumentProcessor:
             logger.error(f"Layout-aware OCR extraction failed: {e}")
             return ""
     
-    def _extract_text_advanced(self, image_path: str) -> str:
+    def _extract_text_advanced(self, image_path: Union[str, Image.Image]) -> str:
         """Extract text using docling's advanced models."""
         try:
-            with Image.open(image_path) as img:
-                if img.mode != 'RGB':
-                    img = img.extract('RGB')
-                
-                results = self.ocr_reader.readtext(img)
-                texts = []
-                for (bbox, text, confidence) in results:
-                    if confidence > 0.5:
-                        texts.append(text)
-                
-                return ' '.join(texts)
+            img = self._load_rgb_image(image_path)
+            results = self.ocr_reader.readtext(np.asarray(img))
+            return _join_confident_text(results)
                 
         except Exception as e:
             logger.error(f"Advanced OCR extraction failed: {e}")
             return ""
     
-    def _extract_text_with_layout_advanced(self, image_path: str) -> str:
+    def extract_text_with_layout_batch(self, image_paths: List[str], batch_size: int = 4) -> List[str]:
+        """Extract layout-aware text from several images, batching layout prediction.
+        
+        Args:
+            image_paths: Paths to the image files
+            batch_size: Number of images passed to the layout model at once
+            
+        Returns:
+            Layout-aware markdown for each image, in input order
+        """
+        results = []
+        for start in range(0, len(image_paths), batch_size):
+            batch = image_paths[start:start + batch_size]
+            try:
+                images = [self._load_rgb_image(image_path) for image_path in batch]
+            except Exception as e:
+                logger.warning(f"Failed to load image batch, retrying one at a time: {e}")
+                results.extend(self.extract_text_with_layout(image_path) for image_path in batch)
+                continue
+            
+            try:
+                # Older docling-ibm-models releases only expose per-image predict()
+                if hasattr(self.layout_predictor, 'predict_batch'):
+                    batch_predictions = self.layout_predictor.predict_batch(images)
+                else:
+                    batch_predictions = [self.layout_predictor.predict(img) for img in images]
+                
+                for img, layout_results in zip(images, batch_predictions):
+                    try:
+                        results.append(self._build_layout_markdown(img, list(layout_results)))
+                    except Exception as e:
+                        logger.error(f"Advanced layout-aware OCR failed: {e}")
+                        results.append("")
+            except Exception as e:
+                logger.error(f"Batched layout prediction failed: {e}")
+                results.extend("" for _ in batch)
+            finally:
+                # Close only the images decoded here, not ones the caller passed in
+                for source, img in zip(batch, images):
+                    if img is not source:
+                        img.close()
+        return results
+    
+    def _load_rgb_image(self, image_path: Union[str, Image.Image]) -> Image.Image:
+        """Load an image fully into memory as RGB; decoded images are reused as-is."""
+        if isinstance(image_path, Image.Image):
+            return image_path if image_path.mode == 'RGB' else image_path.convert('RGB')
+        with Image.open(image_path) as img:
+            return img.convert('RGB')
+    
+    def _extract_text_with_layout_advanced(self, image_path: Union[str, Image.Image]) -> str:
         """Extract text with layout awareness using docling's neural models."""
         try:
-            with Image.open(image_path) as img:
-                if img.mode != 'RGB':
-                    img = img.extract('RGB')
-                
-                # Get layout predictions using neural model
-                layout_results = list(self.layout_predictor.predict(img))
-                
-                # Process layout results and extract text
-                text_blocks = []
-                table_blocks = []
-                
-                for pred in layout_results:
-                    label = pred.get('label', '').lower().replace(' ', '_').replace('-', '_')
-                    
-                    # Construct bbox from l, t, r, b
-                    if all(k in pred for k in ['l', 't', 'r', 'b']):
-                        bbox = [pred['l'], pred['t'], pred['r'], pred['b']]
-                    else:
-                        bbox = pred.get('bbox') or pred.get('box')
-                        if not bbox:
-                            continue
-                    
-                    # Extract text from this region using OCR
-                    region_text = self._extract_text_from_region(img, bbox)
-                    
-                    if not region_text or pred.get('confidence', 1.0) < 0.5:
-                        continue
-                    
-                    from .layout_detector import LayoutElement
-                    
-                    # Handle different element types
-                    if label in ['table', 'document_index']:
-                        # Process tables separately
-                        table_blocks.append({
-                            'text': region_text,
-                            'bbox': bbox,
-                            'label': label,
-                            'confidence': pred.get('confidence', 1.0)
-                        })
-                    elif label in ['title', 'section_header', 'subtitle_level_1']:
-                        # Headers
-                        text_blocks.append(LayoutElement(
-                            text=region_text,
-                            x=bbox[0],
-                            y=bbox[1],
-                            width=bbox[2] - bbox[0],
-                            height=bbox[3] - bbox[1],
-                            element_type='heading',
-                            confidence=pred.get('confidence', 1.0)
-                        ))
-                    elif label in ['list_item']:
-                        # List items
-                        text_blocks.append(LayoutElement(
-                            text=region_text,
-                            x=bbox[0],
-                            y=bbox[1],
-                            width=bbox[2] - bbox[0],
-                            height=bbox[3] - bbox[1],
-                            element_type='list_item',
-                            confidence=pred.get('confidence', 1.0)
-                        ))
-                    else:
-                        # Regular text/paragraphs
-                        text_blocks.append(LayoutElement(
-                            text=region_text,
-                            x=bbox[0],
-                            y=bbox[1],
-                            width=bbox[2] - bbox[0],
-                            height=bbox[3] - bbox[1],
-                            element_type='paragraph',
-                            confidence=pred.get('confidence', 1.0)
-                        ))
-                
-                # Sort by position (top to bottom, left to right)
-                text_blocks.sort(key=lambda x: (x.y, x.x))
-                
-                # Process tables using table structure model
-                processed_tables = self._process_tables_with_structure_model(img, table_blocks)
-                
-                # Convert to markdown with proper structure
-                return self._convert_to_structured_markdown_advanced(text_blocks, processed_tables, img.size)
+            img = self._load_rgb_image(image_path)
+            
+            # Get layout predictions using neural model
+            layout_results = list(self.layout_predictor.predict(img))
+            
+            return self._build_layout_markdown(img, layout_results)
                 
         except Exception as e:
             logger.error(f"Advanced layout-aware OCR failed: {e}")
             return ""
     
+    def _build_layout_markdown(self, img: Image.Image, layout_results: List[Dict]) -> str:
+        """Run OCR over predicted layout regions and assemble structured markdown."""
+        # Process layout results and extract text
+        text_blocks = []
+        table_blocks = []
+        
+        for pred in layout_results:
+            label = pred.get('label', '').lower().replace(' ', '_').replace('-', '_')
+            
+            # Construct bbox from l, t, r, b
+            if all(k in pred for k in ['l', 't', 'r', 'b']):
+                bbox = [pred['l'], pred['t'], pred['r'], pred['b']]
+            else:
+                bbox = pred.get('bbox') or pred.get('box')
+                if not bbox:
+                    continue
+            
+            # Extract text from this region using OCR
+            region_text = self._extract_text_from_region(img, bbox)
+            
+            if not region_text or pred.get('confidence', 1.0) < 0.5:
+                continue
+            
+            # Handle different element types
+            if label in ['table', 'document_index']:
+                # Process tables separately
+                table_blocks.append({
+                    'text': region_text,
+                    'bbox': bbox,
+                    'label': label,
+                    'confidence': pred.get('confidence', 1.0)
+                })
+            elif label in ['title', 'section_header', 'subtitle_level_1']:
+                # Headers
+                text_blocks.append(LayoutElement(
+                    text=region_text,
+                    x=bbox[0],
+                    y=bbox[1],
+                    width=bbox[2] - bbox[0],
+                    height=bbox[3] - bbox[1],
+                    element_type='heading',
+                    confidence=pred.get('confidence', 1.0)
+                ))
+            elif label in ['list_item']:
+                # List items
+                text_blocks.append(LayoutElement(
+                    text=region_text,
+                    x=bbox[0],
+                    y=bbox[1],
+                    width=bbox[2] - bbox[0],
+                    height=bbox[3] - bbox[1],
+                    element_type='list_item',
+                    confidence=pred.get('confidence', 1.0)
+                ))
+            else:
+                # Regular text/paragraphs
+                text_blocks.append(LayoutElement(
+                    text=region_text,
+                    x=bbox[0],
+                    y=bbox[1],
+                    width=bbox[2] - bbox[0],
+                    height=bbox[3] - bbox[1],
+                    element_type='paragraph',
+                    confidence=pred.get('confidence', 1.0)
+                ))
+        
+        # Sort by position (top to bottom, left to right)
+        text_blocks.sort(key=lambda x: (x.y, x.x))
+        
+        # Process tables using table structure model
+        processed_tables = self._process_tables_with_structure_model(img, table_blocks)
+        
+        # Convert to markdown with proper structure
+        return self._convert_to_structured_markdown_advanced(text_blocks, processed_tables, img.size)
+    
     def _process_tables_with_structure_model(self, img: Image.Image, table_blocks: List[Dict]) -> List[Dict]:
         """Process tables using the table structure model."""
         processed_tables = []
@@ -473,11 +522,7 @@ class NeuralDocumentProcessor:
         """Extract text from numpy array region."""
         try:
             results = self.ocr_reader.readtext(region_np)
-            texts = []
-            for (_, text, confidence) in results:
-                if confidence > 0.5:
-                    texts.append(text)
-            return ' '.join(texts)
+            return _join_confident_text(results)
         except Exception as e:
             logger.error(f"Failed to extract text from numpy region: {e}")
             return ""
@@ -522,29 +567,29 @@ class NeuralDocumentProcessor:
             return ""
         
         # Find the first non-empty row to use as header
-        header_row = None
-        for row in grid:
+        header_index = None
+        for i, row in enumerate(grid):
             if any(cell.strip() for cell in row):
-                header_row = row
+                header_index = i
                 break
         
-        if not header_row:
+        if header_index is None:
             return ""
         
         # Use the header row as is (preserve all columns)
-        header_cells = [cell.strip() if cell else "" for cell in header_row]
+        header_cells = [cell.strip() if cell else "" for cell in grid[header_index]]
         
-        markdown_lines = []
-        markdown_lines.append("| " + " | ".join(header_cells) + " |")
-        markdown_lines.append("|" + "|".join(["---"] * len(header_cells)) + "|")
+        buf = io.StringIO()
+        buf.write("| " + " | ".join(header_cells) + " |\n")
+        buf.write("|" + "|".join(["---"] * len(header_cells)) + "|")
         
         # Add data rows (skip the header row)
-        header_index = grid.index(header_row)
         for row in grid[header_index + 1:]:
-            cells = [cell.strip() if cell else "" for cell in row]
-            markdown_lines.append("| " + " | ".join(cells) + " |")
+            buf.write("\n| ")
+            buf.write(" | ".join(cell.strip() if cell else "" for cell in row))
+            buf.write(" |")
         
-        return '\n'.join(markdown_lines)
+        return buf.getvalue()
     
     def _convert_to_structured_markdown_advanced(self, text_blocks: List, processed_tables: List[Dict], img_size: Tuple[int, int]) -> str:
         """Convert text blocks and tables to structured markdown."""
@@ -553,34 +598,24 @@ class NeuralDocumentProcessor:
         # Sort all elements by position
         all_elements = []
         
-        # Add text blocks
+        # Add text blocks as (y, x, type, element)
         for block in text_blocks:
-            all_elements.append({
-                'type': 'text',
-                'element': block,
-                'y': block.y,
-                'x': block.x
-            })
+            all_elements.append((block.y, block.x, 'text', block))
         
         # Add tables
         for table in processed_tables:
             if 'bbox' in table:
-                all_elements.append({
-                    'type': 'table',
-                    'element': table,
-                    'y': table['bbox'][1],
-                    'x': table['bbox'][0]
-                })
+                all_elements.append((table['bbox'][1], table['bbox'][0], 'table', table))
             else:
                 logger.warning(f"Table has no bbox, skipping: {table}")
         
         # Sort by position
-        all_elements.sort(key=lambda x: (x['y'], x['x']))
+        all_elements.sort(key=itemgetter(0, 1))
         
         # Convert to markdown
-        for element in all_elements:
-            if element['type'] == 'text':
-                block = element['element']
+        for _, _, element_type, element in all_elements:
+            if element_type == 'text':
+                block = element
                 text = block.text.strip()
                 if not text:
                     continue
@@ -596,8 +631,8 @@ class NeuralDocumentProcessor:
                     markdown_parts.append(text)
                     markdown_parts.append("")
                     
-            elif element['type'] == 'table':
-                table = element['element']
+            elif element_type == 'table':
+                table = element
                 if table['type'] == 'structured_table':
                     # Convert structured table to markdown
                     table_md = self._convert_table_to_markdown(table)
@@ -632,12 +667,7 @@ class NeuralDocumentProcessor:
             
             # Use OCR on the region
             results = self.ocr_reader.readtext(region_np)
-            texts = []
-            for (_, text, confidence) in results:
-                if confidence > 0.5:
-                    texts.append(text)
-            
-            return ' '.join(texts)
+            return _join_confident_text(results)
             
         except Exception as e:
             logger.error(f"Failed to extract text from region: {e}")
@@ -1,12 +1,43 @@
 """OCR Service abstraction for neural document processing."""
 
-import os
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Process-wide OCR services keyed by provider, see OCRServiceFactory.get_shared_service
+_shared_services: Dict[str, "OCRService"] = {}
+_shared_services_lock = threading.Lock()
+
+
+def _load_image(image_path):
+    """Decode an image once so the OCR models can reuse it.
+    
+    Args:
+        image_path: Path to the image file, or an already decoded PIL image
+        
+    Returns:
+        RGB PIL image, or None if the file is missing or unreadable
+    """
+    if not isinstance(image_path, str):
+        # Already in memory (e.g. a rendered PDF page)
+        return image_path if image_path.mode == 'RGB' else image_path.convert('RGB')
+    
+    # Let the open itself report a missing file instead of stat-ing first
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            logger.info(f"Image loaded successfully: {img.size} {img.mode}")
+            return img.convert('RGB')
+    except FileNotFoundError:
+        logger.error(f"Image file does not exist: {image_path}")
+        return None
+    except Exception as e:
+        logger.error(f"Failed to load image: {e}")
+        return None
+
 
 class OCRService(ABC):
     """Abstract base class for OCR services."""
@@ -34,6 +65,21 @@ class OCRService(ABC):
             Layout-aware extracted text as markdown
         """
         pass
+    
+    def extract_text_with_layout_batch(self, image_paths: List[str], batch_size: int = 4) -> List[str]:
+        """Extract layout-aware text from several images.
+        
+        Services that can run their model on batches override this; the
+        default processes the images one at a time.
+        
+        Args:
+            image_paths: Paths to the image files
+            batch_size: Number of images to process per model call
+            
+        Returns:
+            Layout-aware extracted text for each image, in input order
+        """
+        return [self.extract_text_with_layout(image_path) for image_path in image_paths]
 
 
 class NanonetsOCRService(OCRService):
@@ -63,22 +109,13 @@ class NanonetsOCRService(OCRService):
     def extract_text(self, image_path: str) -> str:
         """Extract text using Nanonets OCR."""
         try:
-            # Validate image file
-            if not os.path.exists(image_path):
-                logger.error(f"Image file does not exist: {image_path}")
+            # Decode once and hand the pixels to the model
+            img = _load_image(image_path)
+            if img is None:
                 return ""
             
-            # Check if file is readable
             try:
-                from PIL import Image
-                with Image.open(image_path) as img:
-                    logger.info(f"Image loaded successfully: {img.size} {img.mode}")
-            except Exception as e:
-                logger.error(f"Failed to load image: {e}")
-                return ""
-            
-            try:
-                text = self._processor.extract_text(image_path)
+                text = self._processor.extract_text(img)
                 logger.info(f"Extracted text length: {len(text)}")
                 return text.strip()
             except Exception as e:
@@ -92,22 +129,13 @@ class NanonetsOCRService(OCRService):
     def extract_text_with_layout(self, image_path: str) -> str:
         """Extract text with layout awareness using Nanonets OCR."""
         try:
-            # Validate image file
-            if not os.path.exists(image_path):
-                logger.error(f"Image file does not exist: {image_path}")
+            # Decode once and hand the pixels to the model
+            img = _load_image(image_path)
+            if img is None:
                 return ""
             
-            # Check if file is readable
             try:
-                from PIL import Image
-                with Image.open(image_path) as img:
-                    logger.info(f"Image loaded successfully: {img.size} {img.mode}")
-            except Exception as e:
-                logger.error(f"Failed to load image: {e}")
-                return ""
-            
-            try:
-                text = self._processor.extract_text_with_layout(image_path)
+                text = self._processor.extract_text_with_layout(img)
                 logger.info(f"Layout-aware extracted text length: {len(text)}")
                 return text.strip()
             except Exception as e:
@@ -117,6 +145,18 @@ class NanonetsOCRService(OCRService):
         except Exception as e:
             logger.error(f"Nanonets OCR layout-aware extraction failed: {e}")
             return ""
+    
+    def extract_text_with_layout_batch(self, image_paths: List[str], batch_size: int = 4) -> List[str]:
+        """Extract layout-aware text from several images in batched model calls."""
+        # Unreadable paths are handled by the processor, which returns empty text for them
+        try:
+            batch_texts = self._processor.extract_text_batch(image_paths, batch_size=batch_size)
+        except Exception as e:
+            logger.error(f"Nanonets OCR batch extraction failed: {e}")
+            return [""] * len(image_paths)
+        
+        logger.info(f"Batch extracted text from {len(image_paths)} images")
+        return [text.strip() for text in batch_texts]
 
 
 class NeuralOCRService(OCRService):
@@ -131,22 +171,13 @@ class NeuralOCRService(OCRService):
     def extract_text(self, image_path: str) -> str:
         """Extract text using Neural OCR (docling models)."""
         try:
-            # Validate image file
-            if not os.path.exists(image_path):
-                logger.error(f"Image file does not exist: {image_path}")
+            # Decode once and hand the pixels to the model
+            img = _load_image(image_path)
+            if img is None:
                 return ""
             
-            # Check if file is readable
             try:
-                from PIL import Image
-                with Image.open(image_path) as img:
-                    logger.info(f"Image loaded successfully: {img.size} {img.mode}")
-            except Exception as e:
-                logger.error(f"Failed to load image: {e}")
-                return ""
-            
-            try:
-                text = self._processor.extract_text(image_path)
+                text = self._processor.extract_text(img)
                 logger.info(f"Extracted text length: {len(text)}")
                 return text.strip()
             except Exception as e:
@@ -160,22 +191,13 @@ class NeuralOCRService(OCRService):
     def extract_text_with_layout(self, image_path: str) -> str:
         """Extract text with layout awareness using Neural OCR."""
         try:
-            # Validate image file
-            if not os.path.exists(image_path):
-                logger.error(f"Image file does not exist: {image_path}")
-                return ""
-            
-            # Check if file is readable
-            try:
-                from PIL import Image
-                with Image.open(image_path) as img:
-                    logger.info(f"Image loaded successfully: {img.size} {img.mode}")
-            except Exception as e:
-                logger.error(f"Failed to load image: {e}")
+            # Decode once and hand the pixels to the model
+            img = _load_image(image_path)
+            if img is None:
                 return ""
             
             try:
-                text = self._processor.extract_text_with_layout(image_path)
+                text = self._processor.extract_text_with_layout(img)
                 logger.info(f"Layout-aware extracted text length: {len(text)}")
                 return text.strip()
             except Exception as e:
@@ -185,6 +207,18 @@ class NeuralOCRService(OCRService):
         except Exception as e:
             logger.error(f"Neural OCR layout-aware extraction failed: {e}")
             return ""
+    
+    def extract_text_with_layout_batch(self, image_paths: List[str], batch_size: int = 4) -> List[str]:
+        """Extract layout-aware text from several images with batched layout prediction."""
+        # Unreadable paths are handled by the processor, which returns empty text for them
+        try:
+            batch_texts = self._processor.extract_text_with_layout_batch(image_paths, batch_size=batch_size)
+        except Exception as e:
+            logger.error(f"Neural OCR batch extraction failed: {e}")
+            return [""] * len(image_paths)
+        
+        logger.info(f"Batch extracted text from {len(image_paths)} images")
+        return [text.strip() for text in batch_texts]
 
 
 class OCRServiceFactory:
@@ -212,6 +246,34 @@ class OCRServiceFactory:
         else:
             raise ValueError(f"Unsupported OCR provider: {provider}")
     
+    @staticmethod
+    def get_shared_service(provider: str = None) -> OCRService:
+        """Get the process-wide OCR service for a provider, creating it on first use.
+        
+        Model weights are loaded once, however many processors or threads ask for them.
+        
+        Args:
+            provider: OCR provider name (defaults to config)
+            
+        Returns:
+            Shared OCRService instance
+        """
+        from docstrange.config import InternalConfig
+        
+        if provider is None:
+            provider = getattr(InternalConfig, 'ocr_provider', 'nanonets')
+        provider = provider.lower()
+        
+        service = _shared_services.get(provider)
+        if service is None:
+            with _shared_services_lock:
+                # Another thread may have finished loading while we waited
+                service = _shared_services.get(provider)
+                if service is None:
+                    service = OCRServiceFactory.create_service(provider)
+                    _shared_services[provider] = service
+        return service
+    
     @staticmethod
     def get_available_providers() -> List[str]:
         """Get list of available OCR providers.
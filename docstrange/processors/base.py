@@ -6,7 +6,9 @@ from typing import Any, Dict, Optional
 from ..result import ConversionResult
 from docstrange.config import InternalConfig
 import os
-import stat
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class BaseProcessor(ABC):
@@ -62,24 +64,27 @@ class BaseProcessor(ABC):
         Returns:
             Dictionary containing file metadata
         """
+        file_path_str = os.fspath(file_path)
+        metadata = {
+            "processor": self.__class__.__name__,
+            "preserve_layout": self.preserve_layout,
+            "include_images": self.include_images,
+            "ocr_enabled": self.ocr_enabled
+        }
+        
         try:
-            stat = os.stat(file_path)
-            # Ensure file_path is a string for splitext
-            file_path_str = str(file_path)
-            return {
-                "file_size": stat.st_size,
-                "file_extension": os.path.splitext(file_path_str)[1].lower(),
-                "file_name": os.path.basename(file_path_str),
-                "processor": self.__class__.__name__,
-                "preserve_layout": self.preserve_layout,
-                "include_images": self.include_images,
-                "ocr_enabled": self.ocr_enabled
-            }
-        except Exception as e:
+            # A single stat call provides size and timestamps
+            st = os.stat(file_path_str)
+        except OSError as e:
             logger.warning(f"Failed to get metadata for {file_path}: {e}")
-            return {
-                "processor": self.__class__.__name__,
-                "preserve_layout": self.preserve_layout,
-                "include_images": self.include_images,
-                "ocr_enabled": self.ocr_enabled
-            } 
\ No newline at end of file
+            return metadata
+        
+        metadata.update({
+            "file_size": st.st_size,
+            "file_extension": os.path.splitext(file_path_str)[1].lower(),
+            "file_name": os.path.basename(file_path_str),
+            "created_time": st.st_ctime,
+            "modified_time": st.st_mtime,
+            "access_time": st.st_atime
+        })
+        return metadata
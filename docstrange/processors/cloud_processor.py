@@ -1,17 +1,95 @@
 """Cloud processor for Nanonets API integration."""
 
 import os
-import requests
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
 
 from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError
+from ..config import InternalConfig
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for the large API payloads, fall back to the stdlib
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any, indent: Optional[int] = None) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any, indent: Optional[int] = None) -> str:
+        return json.dumps(obj, indent=indent)
+
+
+def _schema_digest(json_schema: dict) -> str:
+    """Return a stable digest of a JSON schema, independent of key order."""
+    canonical = json.dumps(json_schema, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Output types accepted by the extraction API
+_VALID_OUTPUT_TYPES = ("markdown", "flat-json", "html", "csv", "specified-fields", "specified-json")
+
+
+def _validate_output_type(output_type: str) -> str:
+    """Return output_type if the API accepts it, otherwise fall back to markdown."""
+    if output_type not in _VALID_OUTPUT_TYPES:
+        logger.warning(f"Invalid output type '{output_type}' for cloud API. Using 'markdown'.")
+        return "markdown"
+    return output_type
+
+
+def _cache_key(output_type: str, specified_fields: Optional[list] = None, json_schema: Optional[dict] = None) -> str:
+    """Build the key a response is cached under from the output type and request parameters."""
+    cache_key = output_type
+    if specified_fields:
+        cache_key += f"_fields_{','.join(sorted(specified_fields))}"
+    if json_schema:
+        cache_key += f"_schema_{_schema_digest(json_schema)}"
+    return cache_key
+
+# Gateway errors worth retrying an upload for, and how often / how patiently
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_UPLOAD_RETRIES = 3
+_UPLOAD_BACKOFF = 0.3  # Seconds before the first retry, doubled for each one after
+
+# MIME types sent with cloud uploads, keyed by lowercase file extension
+_CONTENT_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.xls': 'application/vnd.ms-excel',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.txt': 'text/plain',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff',
+    '.tif': 'image/tiff'
+}
+
 
 class CloudConversionResult(ConversionResult):
     """Enhanced ConversionResult for cloud mode with lazy API calls."""
@@ -22,94 +100,38 @@ class CloudConversionResult(ConversionResult):
         self.file_path = file_path
         self.cloud_processor = cloud_processor
         self._cached_outputs = {}  # Cache API responses by output type
+        self._cache_lock = threading.Lock()
+        self._file_hash = None
+    
+    def prefetch(self, output_types: List[str]) -> None:
+        """Fetch several output types from the cloud API concurrently.
+        
+        Subsequent export calls for these types are served from the cache.
+        
+        Args:
+            output_types: Cloud output types to fetch (e.g. ["markdown", "flat-json"])
+        """
+        if not output_types:
+            return
+        with ThreadPoolExecutor(max_workers=len(output_types)) as executor:
+            list(executor.map(self._get_cloud_output, output_types))
     
     def _get_cloud_output(self, output_type: str, specified_fields: Optional[list] = None, json_schema: Optional[dict] = None) -> str:
         """Get output from cloud API for specific type, with caching."""
-        # Validate output type
-        valid_output_types = ["markdown", "flat-json", "html", "csv", "specified-fields", "specified-json"]
-        if output_type not in valid_output_types:
-            logger.warning(f"Invalid output type '{output_type}' for cloud API. Using 'markdown'.")
-            output_type = "markdown"
-        
-        # Create cache key based on output type and parameters
-        cache_key = output_type
-        if specified_fields:
-            cache_key += f"_fields_{','.join(specified_fields)}"
-        if json_schema:
-            cache_key += f"_schema_{hash(str(json_schema))}"
-        
-        if cache_key in self._cached_outputs:
-            return self._cached_outputs[cache_key]
+        output_type = _validate_output_type(output_type)
+        cache_key = _cache_key(output_type, specified_fields, json_schema)
+        
+        cached = self._get_cached_output(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            # Prepare headers - API key is optional
-            headers = {}
-            if self.cloud_processor.api_key:
-                headers['Authorization'] = f'Bearer {self.cloud_processor.api_key}'
+            content = self.cloud_processor._post(self.file_path, output_type, specified_fields, json_schema)
+            
+            # Cache the result
+            self._store_output(cache_key, content)
+            return content
             
-            # Prepare file for upload
-            with open(self.file_path, 'rb') as file:
-                files = {
-                    'file': (os.path.basename(self.file_path), file, self.cloud_processor._get_content_type(self.file_path))
-                }
-                
-                data = {
-                    'output_type': output_type
-                }
-                
-                # Add model_type if specified
-                if self.cloud_processor.model_type:
-                    data['model_type'] = self.cloud_processor.model_type
-                
-                # Add field extraction parameters
-                if output_type == "specified-fields" and specified_fields:
-                    data['specified_fields'] = ','.join(specified_fields)
-                elif output_type == "specified-json" and json_schema:
-                    data['json_schema'] = json.dumps(json_schema)
-                
-                # Log the request
-                if self.cloud_processor.api_key:
-                    logger.info(f"Making cloud API call with authenticated access for {output_type} on {self.file_path}")
-                else:
-                    logger.info(f"Making cloud API call without authentication (free tier) for {output_type} on {self.file_path}")
-                
-                # Make API request
-                response = requests.post(
-                    self.cloud_processor.api_url,
-                    headers=headers,
-                    files=files,
-                    data=data,
-                    timeout=300
-                )
-                
-                # Handle rate limiting (429) specifically
-                if response.status_code == 429:
-                    if not self.cloud_processor.api_key:
-                        error_msg = (
-                            "Rate limit exceeded for free tier (limited calls daily). "
-                            "Run 'docstrange login' for 10,000 docs/month, or use an API key from https://app.nanonets.com/#/keys.\n"
-                            "Examples:\n"
-                            "  - CLI: docstrange login\n"
-                            "  - Python: DocumentExtractor()  # after login (uses cached credentials)\n"
-                            "  - Python: DocumentExtractor(api_key='YOUR_API_KEY')  # alternative"
-                        )
-                        logger.error(error_msg)
-                        raise ConversionError(error_msg)
-                    else:
-                        error_msg = "Rate limit exceeded (10k/month). Please try again later."
-                        logger.error(error_msg)
-                        raise ConversionError(error_msg)
-                
-                response.raise_for_status()
-                result_data = response.json()
-                
-                # Extract content from response
-                content = self.cloud_processor._extract_content_from_response(result_data)
-                
-                # Cache the result
-                self._cached_outputs[cache_key] = content
-                return content
-                
         except ConversionError:
             # Re-raise ConversionError (like rate limiting) without fallback
             raise
@@ -118,12 +140,85 @@ class CloudConversionResult(ConversionResult):
             # Try fallback to local conversion for other errors
             return self._convert_locally(output_type)
     
+    def _get_cached_output(self, cache_key: str) -> Optional[str]:
+        """Return a response cached in memory or on disk, or None if there is none."""
+        with self._cache_lock:
+            if cache_key in self._cached_outputs:
+                return self._cached_outputs[cache_key]
+        
+        # Same file content and request parameters seen before - skip the upload
+        disk_content = self._read_disk_cache(cache_key)
+        if disk_content is not None:
+            with self._cache_lock:
+                self._cached_outputs[cache_key] = disk_content
+        return disk_content
+    
+    def _store_output(self, cache_key: str, content: str) -> None:
+        """Cache an API response in memory and on disk."""
+        with self._cache_lock:
+            self._cached_outputs[cache_key] = content
+        self._write_disk_cache(cache_key, content)
+    
+    def _get_file_hash(self) -> str:
+        """Get the SHA-256 of the file contents, computed once per result."""
+        if self._file_hash is None:
+            sha256 = hashlib.sha256()
+            with open(self.file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+            self._file_hash = sha256.hexdigest()
+        return self._file_hash
+    
+    def _disk_cache_path(self, cache_key: str) -> Path:
+        """Get the on-disk cache location for a response."""
+        request_key = f"{cache_key}|{self.cloud_processor.model_type or ''}"
+        key_digest = hashlib.blake2b(request_key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cloud_processor.cache_dir / self._get_file_hash() / f"{key_digest}.json"
+    
+    def _read_disk_cache(self, cache_key: str) -> Optional[str]:
+        """Return a cached API response if present and not expired."""
+        if not self.cloud_processor.cache_enabled:
+            return None
+        try:
+            cache_path = self._disk_cache_path(cache_key)
+            if not cache_path.exists():
+                return None
+            if time.time() - cache_path.stat().st_mtime > InternalConfig.cloud_cache_ttl:
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                content = json.load(f)['content']
+            logger.info(f"Using cached cloud response for {cache_key} on {self.file_path}")
+            return content
+        except Exception as e:
+            logger.debug(f"Failed to read cloud cache for {self.file_path}: {e}")
+            return None
+    
+    def _write_disk_cache(self, cache_key: str, content: str) -> None:
+        """Persist an API response to the on-disk cache."""
+        if not self.cloud_processor.cache_enabled:
+            return
+        try:
+            cache_path = self._disk_cache_path(cache_key)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a uniquely named sibling then rename, so concurrent
+            # processes never observe a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'content': content}, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Failed to write cloud cache for {self.file_path}: {e}")
+    
     def _convert_locally(self, output_type: str) -> str:
         """Fallback to local conversion methods."""
         if output_type == "html":
             return super().extract_html()
         elif output_type == "flat-json":
-            return json.dumps(super().extract_data(), indent=2)
+            return _json_dumps(super().extract_data(), indent=2)
         elif output_type == "csv":
             return super().extract_csv(include_all_tables=True)
         else:
@@ -151,7 +246,7 @@ class CloudConversionResult(ConversionResult):
             if specified_fields:
                 # Request specified fields extraction
                 content = self._get_cloud_output("specified-fields", specified_fields=specified_fields)
-                extracted_data = json.loads(content)
+                extracted_data = _json_loads(content)
                 return {
                     "extracted_fields": extracted_data,
                     "format": "specified_fields"
@@ -160,7 +255,7 @@ class CloudConversionResult(ConversionResult):
             elif json_schema:
                 # Request JSON schema extraction
                 content = self._get_cloud_output("specified-json", json_schema=json_schema)
-                extracted_data = json.loads(content)
+                extracted_data = _json_loads(content)
                 return {
                     "structured_data": extracted_data,
                     "format": "structured_json"
@@ -169,7 +264,7 @@ class CloudConversionResult(ConversionResult):
             else:
                 # Standard JSON extraction
                 json_content = self._get_cloud_output("flat-json")
-                parsed_content = json.loads(json_content)
+                parsed_content = _json_loads(json_content)
                 return {
                     "document": parsed_content,
                     "format": "cloud_flat_json"
@@ -213,8 +308,13 @@ class CloudConversionResult(ConversionResult):
 class CloudProcessor(BaseProcessor):
     """Processor for cloud-based document conversion using Nanonets API."""
     
+    # Every format with a known upload MIME type is accepted by the API
+    _SUPPORTED_EXTS = frozenset(_CONTENT_TYPES)
+    
     def __init__(self, api_key: Optional[str] = None, output_type: str = None, model_type: Optional[str] = None, 
-                 specified_fields: Optional[list] = None, json_schema: Optional[dict] = None, **kwargs):
+                 specified_fields: Optional[list] = None, json_schema: Optional[dict] = None,
+                 upload_callback: Optional[Callable[[int, int], None]] = None,
+                 cache_enabled: Optional[bool] = None, cache_dir: Optional[str] = None, **kwargs):
         """Initialize the cloud processor.
         
         Args:
@@ -223,6 +323,12 @@ class CloudProcessor(BaseProcessor):
             model_type: Model type for cloud processing (gemini, openapi, nanonets)
             specified_fields: List of fields to extract (for specified-fields output type)
             json_schema: JSON schema defining fields and types to extract (for specified-json output type)
+            upload_callback: Optional callable receiving (bytes_sent, total_bytes) while a file streams to the API
+            cache_enabled: Whether to keep API responses on disk and reuse them for identical files
+                (defaults to InternalConfig.cloud_cache_enabled, which is off unless DOCSTRANGE_CLOUD_CACHE=1).
+                Cached entries contain the extracted document content.
+            cache_dir: Directory for cached responses (defaults to InternalConfig.cloud_cache_dir,
+                ~/.cache/docstrange/cloud)
         """
         super().__init__(**kwargs)
         self.api_key = api_key
@@ -230,8 +336,26 @@ class CloudProcessor(BaseProcessor):
         self.model_type = model_type
         self.specified_fields = specified_fields
         self.json_schema = json_schema
+        self.upload_callback = upload_callback
+        self.cache_enabled = InternalConfig.cloud_cache_enabled if cache_enabled is None else cache_enabled
+        self.cache_dir = Path(cache_dir or InternalConfig.cloud_cache_dir)
         self.api_url = "https://extraction-api.nanonets.com/extract"
         
+        # Keep-alive connection pool shared by every upload from this processor.
+        # requests is imported here so local-only runs never pay for it.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        self._session = requests.Session()
+        # Only connection failures are retried here; urllib3 can't rewind a streamed
+        # upload body, so retrying gateway errors is left to _post
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        
         # Don't validate output_type during initialization - it will be validated during processing
         # This prevents warnings during DocumentExtractor initialization
     
@@ -239,14 +363,8 @@ class CloudProcessor(BaseProcessor):
         """Check if the processor can handle the file."""
         # Cloud processor supports most common document formats
         # API key is optional - without it, uses rate-limited free tier
-        supported_extensions = {
-            '.pdf', '.docx', '.doc', '.xlsx', '.xls', '.pptx', '.ppt', 
-            '.txt', '.html', '.htm', '.png', '.jpg', '.jpeg', '.gif', 
-            '.bmp', '.tiff', '.tif'
-        }
-        
-        _, ext = os.path.splitext(file_path.lower())
-        return ext in supported_extensions
+        ext = os.path.splitext(file_path)[1].lower()
+        return ext in self._SUPPORTED_EXTS
     
     def process(self, file_path: str) -> CloudConversionResult:
         """Create a lazy CloudConversionResult that will make API calls on demand.
@@ -260,7 +378,10 @@ class CloudProcessor(BaseProcessor):
         Raises:
             ConversionError: If file doesn't exist
         """
-        if not os.path.exists(file_path):
+        # One stat call both checks existence and provides the size
+        try:
+            st = os.stat(file_path)
+        except OSError:
             raise ConversionError(f"File not found: {file_path}")
         
         # Create metadata without making any API calls
@@ -268,7 +389,7 @@ class CloudProcessor(BaseProcessor):
             'source_file': file_path,
             'processing_mode': 'cloud',
             'api_provider': 'nanonets',
-            'file_size': os.path.getsize(file_path),
+            'file_size': st.st_size,
             'model_type': self.model_type,
             'has_api_key': bool(self.api_key)
         }
@@ -285,6 +406,269 @@ class CloudProcessor(BaseProcessor):
             metadata=metadata
         )
     
+    def process_many(self, file_paths: List[str], output_type: Optional[str] = None,
+                     max_workers: int = 16) -> List[CloudConversionResult]:
+        """Process several files on a thread pool and return results with the output prefetched.
+        
+        Uploads share this processor's pooled session, so synchronous callers get
+        concurrent requests without adopting asyncio.
+        
+        Args:
+            file_paths: Paths to the files to process
+            output_type: Cloud output type to fetch (defaults to the processor's output_type, then markdown)
+            max_workers: Maximum number of uploads in flight at once
+            
+        Returns:
+            One CloudConversionResult per file, in input order
+            
+        Raises:
+            ConversionError: If a file doesn't exist or the rate limit is hit
+        """
+        output_type = output_type or self.output_type or "markdown"
+        results = [self.process(file_path) for file_path in file_paths]
+        if not results:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(results))) as executor:
+            list(executor.map(lambda result: result._get_cloud_output(output_type), results))
+        
+        return results
+    
+    async def aprocess(self, file_path: str, output_type: Optional[str] = None,
+                       session: Optional[Any] = None, specified_fields: Optional[list] = None,
+                       json_schema: Optional[dict] = None) -> CloudConversionResult:
+        """Upload a file without blocking the event loop and return a result with the output prefetched.
+        
+        Args:
+            file_path: Path to the file to process
+            output_type: Cloud output type to fetch (defaults to the processor's output_type, then markdown)
+            session: Optional aiohttp.ClientSession to reuse across calls
+            specified_fields: Fields to extract (defaults to the processor's specified_fields)
+            json_schema: JSON schema to extract (defaults to the processor's json_schema)
+            
+        Returns:
+            CloudConversionResult with the requested output cached
+            
+        Raises:
+            ConversionError: If aiohttp is missing, the file doesn't exist, or the rate limit is hit
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ConversionError("aiohttp is required for concurrent cloud uploads. Install it with: pip install aiohttp")
+        
+        if session is None:
+            async with self._create_async_session() as own_session:
+                return await self.aprocess(file_path, output_type, own_session, specified_fields, json_schema)
+        
+        result = self.process(file_path)
+        
+        output_type = _validate_output_type(output_type or self.output_type or "markdown")
+        specified_fields = specified_fields or self.specified_fields
+        json_schema = json_schema or self.json_schema
+        cache_key = _cache_key(output_type, specified_fields, json_schema)
+        
+        # Hashing the file for the disk cache is blocking I/O, so keep it off the event loop
+        if self.cache_enabled:
+            cached = await asyncio.get_running_loop().run_in_executor(None, result._get_cached_output, cache_key)
+        else:
+            cached = result._get_cached_output(cache_key)
+        if cached is not None:
+            return result
+        
+        try:
+            with open(file_path, 'rb') as file:
+                form = aiohttp.FormData()
+                for name, value in self._build_form_data(output_type, specified_fields, json_schema).items():
+                    form.add_field(name, value)
+                form.add_field('file', file, filename=os.path.basename(file_path),
+                               content_type=self._get_content_type(file_path))
+                
+                async with session.post(self.api_url, data=form, timeout=aiohttp.ClientTimeout(total=300)) as response:
+                    if response.status == 429:
+                        raise self._rate_limit_error()
+                    response.raise_for_status()
+                    result_data = _json_loads(await response.read())
+        except ConversionError:
+            raise
+        except Exception as e:
+            # Leave the output uncached; the lazy export path retries and falls back
+            logger.error(f"Failed to get {output_type} from cloud API for {file_path}: {e}")
+            return result
+        
+        content = self._extract_content_from_response(result_data)
+        if self.cache_enabled:
+            await asyncio.get_running_loop().run_in_executor(None, result._store_output, cache_key, content)
+        else:
+            result._store_output(cache_key, content)
+        return result
+    
+    async def aprocess_many(self, file_paths: List[str], output_type: Optional[str] = None,
+                            max_concurrency: int = 16) -> List[CloudConversionResult]:
+        """Upload several files concurrently and return results with the output prefetched.
+        
+        Args:
+            file_paths: Paths to the files to process
+            output_type: Cloud output type to fetch (defaults to the processor's output_type, then markdown)
+            max_concurrency: Maximum number of uploads in flight at once
+            
+        Returns:
+            One CloudConversionResult per file, in input order
+            
+        Raises:
+            ConversionError: If aiohttp is missing, a file doesn't exist, or the rate limit is hit
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(session, file_path: str) -> CloudConversionResult:
+            async with semaphore:
+                return await self.aprocess(file_path, output_type, session)
+        
+        async with self._create_async_session() as session:
+            return list(await asyncio.gather(*(bounded(session, file_path) for file_path in file_paths)))
+    
+    def _create_async_session(self):
+        """Create an aiohttp session with pooled keep-alive connections."""
+        try:
+            import aiohttp
+        except ImportError:
+            raise ConversionError("aiohttp is required for concurrent cloud uploads. Install it with: pip install aiohttp")
+        
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+        return aiohttp.ClientSession(headers=self._build_headers(), connector=connector)
+    
+    def _post(self, file_path: str, output_type: str, specified_fields: Optional[list] = None,
+              json_schema: Optional[dict] = None) -> str:
+        """Upload a file to the extraction API and return the extracted content.
+        
+        Args:
+            file_path: Path to the file to upload
+            output_type: Cloud output type to request
+            specified_fields: Fields to extract (for specified-fields output type)
+            json_schema: JSON schema to extract (for specified-json output type)
+            
+        Returns:
+            Content field of the API response
+            
+        Raises:
+            ConversionError: If the rate limit is exceeded
+        """
+        headers = self._build_headers()
+        data = self._build_form_data(output_type, specified_fields, json_schema)
+        
+        # Log the request
+        if self.api_key:
+            logger.info(f"Making cloud API call with authenticated access for {output_type} on {file_path}")
+        else:
+            logger.info(f"Making cloud API call without authentication (free tier) for {output_type} on {file_path}")
+        
+        # Retry gateway errors with a freshly built body, since a sent upload can't be replayed
+        for attempt in range(_UPLOAD_RETRIES + 1):
+            response = self._send_upload(file_path, headers, data)
+            if response.status_code not in _RETRY_STATUSES or attempt == _UPLOAD_RETRIES:
+                break
+            response.close()
+            delay = _UPLOAD_BACKOFF * (2 ** attempt)
+            logger.warning(f"Cloud API returned {response.status_code} for {file_path}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        
+        with response:
+            # Handle rate limiting (429) specifically
+            if response.status_code == 429:
+                raise self._rate_limit_error()
+            
+            response.raise_for_status()
+            # Parse the raw body directly instead of decoding it to text first
+            result_data = _json_loads(response.content)
+        
+        # Extract content from response
+        return self._extract_content_from_response(result_data)
+    
+    def _send_upload(self, file_path: str, headers: Dict[str, str], data: Dict[str, str]):
+        """Send one multipart upload of a file and return the raw response.
+        
+        Args:
+            file_path: Path to the file to upload
+            headers: Request headers
+            data: Form fields sent alongside the file
+            
+        Returns:
+            requests.Response
+        """
+        headers = dict(headers)
+        
+        # Stream the file upload so large documents are never buffered in memory
+        with open(file_path, 'rb') as file:
+            file_field = (os.path.basename(file_path), file, self._get_content_type(file_path))
+            
+            try:
+                from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+                
+                encoder = MultipartEncoder(fields={**data, 'file': file_field})
+                upload_callback = self.upload_callback
+                if upload_callback:
+                    encoder = MultipartEncoderMonitor(
+                        encoder, lambda monitor: upload_callback(monitor.bytes_read, monitor.len)
+                    )
+                headers['Content-Type'] = encoder.content_type
+                return self._session.post(
+                    self.api_url,
+                    headers=headers,
+                    data=encoder,
+                    timeout=300
+                )
+            except ImportError:
+                # Fallback: requests builds the multipart body in memory
+                return self._session.post(
+                    self.api_url,
+                    headers=headers,
+                    files={'file': file_field},
+                    data=data,
+                    timeout=300
+                )
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """Build request headers - API key is optional."""
+        headers = {}
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        return headers
+    
+    def _build_form_data(self, output_type: str, specified_fields: Optional[list] = None,
+                         json_schema: Optional[dict] = None) -> Dict[str, str]:
+        """Build the form fields sent alongside the uploaded file."""
+        data = {
+            'output_type': output_type
+        }
+        
+        # Add model_type if specified
+        if self.model_type:
+            data['model_type'] = self.model_type
+        
+        # Add field extraction parameters
+        if output_type == "specified-fields" and specified_fields:
+            data['specified_fields'] = ','.join(specified_fields)
+        elif output_type == "specified-json" and json_schema:
+            data['json_schema'] = _json_dumps(json_schema)
+        
+        return data
+    
+    def _rate_limit_error(self) -> ConversionError:
+        """Build the error raised when the API responds with HTTP 429."""
+        if not self.api_key:
+            error_msg = (
+                "Rate limit exceeded for free tier (limited calls daily). "
+                "Run 'docstrange login' for 10,000 docs/month, or use an API key from https://app.nanonets.com/#/keys.\n"
+                "Examples:\n"
+                "  - CLI: docstrange login\n"
+                "  - Python: DocumentExtractor()  # after login (uses cached credentials)\n"
+                "  - Python: DocumentExtractor(api_key='YOUR_API_KEY')  # alternative"
+            )
+        else:
+            error_msg = "Rate limit exceeded (10k/month). Please try again later."
+        logger.error(error_msg)
+        return ConversionError(error_msg)
+    
     def _extract_content_from_response(self, response_data: Dict[str, Any]) -> str:
         """Extract content from API response."""
         try:
@@ -294,7 +678,7 @@ class CloudProcessor(BaseProcessor):
             
             # Fallback: return whole response as JSON if no content field
             logger.warning("No 'content' field found in API response, returning full response")
-            return json.dumps(response_data, indent=2)
+            return _json_dumps(response_data, indent=2)
             
         except Exception as e:
             logger.error(f"Failed to extract content from API response: {e}")
@@ -302,26 +686,5 @@ class CloudProcessor(BaseProcessor):
     
     def _get_content_type(self, file_path: str) -> str:
         """Get content type for file upload."""
-        _, ext = os.path.splitext(file_path.lower())
-        
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            '.xls': 'application/vnd.ms-excel',
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            '.ppt': 'application/vnd.ms-powerpoint',
-            '.txt': 'text/plain',
-            '.html': 'text/html',
-            '.htm': 'text/html',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.bmp': 'image/bmp',
-            '.tiff': 'image/tiff',
-            '.tif': 'image/tiff'
-        }
-        
-        return content_types.get(ext, 'application/octet-stream') 
\ No newline at end of file
+        ext = os.path.splitext(file_path)[1].lower()
+        return _CONTENT_TYPES.get(ext, 'application/octet-stream')
@@ -1,16 +1,70 @@
 """DOCX file processor."""
 
+import io
 import os
+import re
 from typing import Dict, Any
 
+from lxml import etree
+
 from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 
+# Level 2/3 markdown headers that need a blank line in front of them
+_HEADER_RE = re.compile(r'(?<!#)(#{2,3} )')
+
+_W_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+
+# Any vertically or horizontally merged cell within a table
+_MERGE_XPATH = etree.XPath('.//w:vMerge | .//w:gridSpan', namespaces=_W_NS)
+
+# Table structure and text, read straight from the XML instead of the python-docx object graph
+_ROWS_XPATH = etree.XPath('./w:tr', namespaces=_W_NS)
+_CELLS_XPATH = etree.XPath('./w:tc', namespaces=_W_NS)
+_PARAGRAPHS_XPATH = etree.XPath('./w:p', namespaces=_W_NS)
+_GRID_SPAN_XPATH = etree.XPath('string(./w:tcPr/w:gridSpan/@w:val)', namespaces=_W_NS)
+_V_MERGE_CONTINUE_XPATH = etree.XPath(
+    "boolean(./w:tcPr/w:vMerge[not(@w:val) or @w:val='continue'])", namespaces=_W_NS
+)
+
+# Content of a paragraph's own runs (not nested text boxes), in document order
+_RUN_CONTENT_XPATH = etree.XPath('./w:r/* | ./w:hyperlink/w:r/*', namespaces=_W_NS)
+
+_W = '{%s}' % _W_NS['w']
+_T_TAG = _W + 't'
+_BR_TAG = _W + 'br'
+_BR_TYPE_ATTR = _W + 'type'
+
+# Run elements that stand for a single character, as python-docx renders them
+_RUN_CHARS = {
+    _W + 'tab': '\t',
+    _W + 'ptab': '\t',
+    _W + 'cr': '\n',
+    _W + 'noBreakHyphen': '-',
+}
+
+
+def _paragraph_text(p) -> str:
+    """Return the text of a ``w:p`` element the way python-docx's ``Paragraph.text`` does."""
+    parts = []
+    for el in _RUN_CONTENT_XPATH(p):
+        if el.tag == _T_TAG:
+            parts.append(el.text or '')
+        elif el.tag == _BR_TAG:
+            # Page and column breaks carry no text
+            if el.get(_BR_TYPE_ATTR, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CHARS.get(el.tag, ''))
+    return ''.join(parts)
+
 
 class DOCXProcessor(BaseProcessor):
     """Processor for Microsoft Word DOCX and DOC files."""
     
+    _SUPPORTED_EXTS = frozenset({'.docx', '.doc'})
+    
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -20,13 +74,9 @@ class DOCXProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.docx', '.doc']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def process(self, file_path: str) -> ConversionResult:
         """Process the DOCX file and return a conversion result.
@@ -41,19 +91,22 @@ class DOCXProcessor(BaseProcessor):
             FileNotFoundError: If the file doesn't exist
             ConversionError: If processing fails
         """
-        if not os.path.exists(file_path):
+        # One stat call both checks existence and provides the size
+        try:
+            st = os.stat(file_path)
+        except OSError:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         # Initialize metadata
         metadata = {
             "file_path": file_path,
-            "file_size": os.path.getsize(file_path),
+            "file_size": st.st_size,
             "processor": "DOCXProcessor"
         }
         
         # Check file extension - ensure file_path is a string
         file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
+        ext = os.path.splitext(file_path_str)[1].lower()
         
         if ext == '.doc':
             return self._process_doc_file(file_path, metadata)
@@ -88,7 +141,7 @@ class DOCXProcessor(BaseProcessor):
         try:
             from docx import Document
 
-            content_parts = []
+            buf = io.StringIO()
             doc = Document(file_path)
 
             metadata.update({
@@ -106,47 +159,51 @@ class DOCXProcessor(BaseProcessor):
                         level = paragraph.style.name.replace('Heading ', '')
                         try:
                             level_num = int(level)
-                            content_parts.append(f"\n{'#' * min(level_num, 6)} {paragraph.text}\n")
+                            buf.write(f"\n{'#' * min(level_num, 6)} {paragraph.text}\n\n")
                         except ValueError:
-                            content_parts.append(f"\n## {paragraph.text}\n")
+                            buf.write(f"\n## {paragraph.text}\n\n")
                     else:
-                        content_parts.append(paragraph.text)
+                        buf.write(paragraph.text)
+                        buf.write('\n')
 
             # Extract text from tables (improved)
             for table_idx, table in enumerate(doc.tables):
                 # Check if preserve_layout is available (from base class or config)
                 preserve_layout = getattr(self, 'preserve_layout', False)
                 if preserve_layout:
-                    content_parts.append(f"\n### Table {table_idx+1}\n")
+                    buf.write(f"\n### Table {table_idx+1}\n\n")
 
                 # Gather all rows
-                rows = table.rows
+                rows = _ROWS_XPATH(table._tbl)
                 if not rows:
                     continue
 
-                # Detect merged cells (optional warning)
-                merged_warning = False
-                for row in rows:
-                    for cell in row.cells:
-                        if len(cell._tc.xpath('.//w:vMerge')) > 0 or len(cell._tc.xpath('.//w:gridSpan')) > 0:
-                            merged_warning = True
-                            break
-                    if merged_warning:
-                        break
-                if merged_warning:
-                    content_parts.append("*Warning: Table contains merged cells which may not render correctly in markdown.*\n")
+                # Detect merged cells (optional warning) with one query per table
+                if _MERGE_XPATH(table._tbl):
+                    buf.write("*Warning: Table contains merged cells which may not render correctly in markdown.*\n\n")
 
                 # Row limit for large tables
                 row_limit = 20
                 if len(rows) > row_limit:
-                    content_parts.append(f"*Table truncated to first {row_limit} rows out of {len(rows)} total.*\n")
+                    buf.write(f"*Table truncated to first {row_limit} rows out of {len(rows)} total.*\n\n")
 
                 # Build table data
                 table_data = []
-                for i, row in enumerate(rows):
-                    if i >= row_limit:
-                        break
-                    row_data = [cell.text.strip().replace('\n', ' ') for cell in row.cells]
+                merged_above = {}  # grid column -> text of the cell starting there in the previous row
+                for row in rows[:row_limit]:
+                    row_data = []
+                    for tc in _CELLS_XPATH(row):
+                        col = len(row_data)
+                        if _V_MERGE_CONTINUE_XPATH(tc):
+                            # Vertically merged continuation: repeat the text above, as python-docx does
+                            cell_text = merged_above.get(col, '')
+                        else:
+                            cell_text = '\n'.join(_paragraph_text(p) for p in _PARAGRAPHS_XPATH(tc))
+                            cell_text = cell_text.strip().replace('\n', ' ')
+                        merged_above[col] = cell_text
+                        # Repeat horizontally merged cells across their span, as python-docx does
+                        span = _GRID_SPAN_XPATH(tc)
+                        row_data.extend([cell_text] * (int(span) if span else 1))
                     table_data.append(row_data)
 
                 # Ensure all rows have the same number of columns
@@ -159,13 +216,13 @@ class DOCXProcessor(BaseProcessor):
                 if table_data:
                     header = table_data[0]
                     separator = ["---"] * len(header)
-                    content_parts.append("| " + " | ".join(header) + " |")
-                    content_parts.append("| " + " | ".join(separator) + " |")
+                    buf.write("| " + " | ".join(header) + " |\n")
+                    buf.write("| " + " | ".join(separator) + " |\n")
                     for row in table_data[1:]:
-                        content_parts.append("| " + " | ".join(row) + " |")
-                    content_parts.append("")
+                        buf.write("| " + " | ".join(row) + " |\n")
+                    buf.write('\n')
 
-            content = '\n'.join(content_parts)
+            content = buf.getvalue()
             content = self._clean_content(content)
             return ConversionResult(content, metadata)
         except ImportError:
@@ -182,21 +239,12 @@ class DOCXProcessor(BaseProcessor):
         Returns:
             Cleaned text content
         """
-        # Remove excessive whitespace and normalize
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove excessive whitespace
-            line = ' '.join(line.split())
-            if line.strip():
-                cleaned_lines.append(line)
-        
-        # Join lines and add proper spacing
-        content = '\n'.join(cleaned_lines)
+        # Collapse whitespace within each line and drop blank lines in one pass
+        content = '\n'.join(
+            line for line in (' '.join(raw.split()) for raw in content.split('\n')) if line
+        )
         
         # Add spacing around headers
-        content = content.replace('## ', '\n## ')
-        content = content.replace('### ', '\n### ')
+        content = _HEADER_RE.sub(r'\n\1', content)
         
         return content.strip() 
\ No newline at end of file
@@ -1,20 +1,31 @@
 """Excel file processor."""
 
+import io
 import os
 import logging
+import re
 from typing import Dict, Any
 
 from .base import BaseProcessor
+from ..config import InternalConfig
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Runs of whitespace other than newlines
+_INLINE_WS_RE = re.compile(r'[^\S\n]+')
+
+# A line break together with surrounding spaces and any blank lines after it
+_LINE_BREAK_RE = re.compile(r' *\n[ \n]*')
+
 
 class ExcelProcessor(BaseProcessor):
     """Processor for Excel files (XLSX, XLS) and CSV files."""
     
+    _SUPPORTED_EXTS = frozenset({'.xlsx', '.xls', '.csv'})
+    
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -24,13 +35,9 @@ class ExcelProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.xlsx', '.xls', '.csv']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def process(self, file_path: str) -> ConversionResult:
         """Process the Excel file and return a conversion result.
@@ -50,7 +57,7 @@ class ExcelProcessor(BaseProcessor):
         
         # Check file extension - ensure file_path is a string
         file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
+        ext = os.path.splitext(file_path_str)[1].lower()
         
         if ext == '.csv':
             return self._process_csv(file_path)
@@ -69,15 +76,15 @@ class ExcelProcessor(BaseProcessor):
         try:
             import pandas as pd
             
-            df = pd.read_csv(file_path)
-            content_parts = []
+            # Stream very large files so only one chunk is in memory at a time
+            if os.path.getsize(file_path) > InternalConfig.csv_chunk_threshold:
+                return self._process_csv_chunked(file_path, pd)
             
-            content_parts.append(f"# CSV Data: {os.path.basename(file_path)}")
-            content_parts.append("")
+            df = self._downcast_numeric(self._read_csv(file_path, pd), pd)
             
             # Convert DataFrame to markdown table
             table_md = self._dataframe_to_markdown(df, pd)
-            content_parts.append(table_md)
+            content = f"# CSV Data: {os.path.basename(file_path)}\n\n{table_md}"
             
             metadata = {
                 "row_count": len(df),
@@ -86,8 +93,6 @@ class ExcelProcessor(BaseProcessor):
                 "extractor": "pandas"
             }
             
-            content = '\n'.join(content_parts)
-            
             return ConversionResult(content, metadata)
             
         except ImportError:
@@ -95,6 +100,63 @@ class ExcelProcessor(BaseProcessor):
         except Exception as e:
             raise ConversionError(f"Failed to process CSV file {file_path}: {str(e)}")
     
+    def _process_csv_chunked(self, file_path: str, pd) -> ConversionResult:
+        """Process a large CSV file chunk by chunk.
+        
+        Args:
+            file_path: Path to the CSV file to process
+            pd: pandas module reference
+            
+        Returns:
+            ConversionResult containing the processed content
+        """
+        buf = io.StringIO()
+        buf.write(f"# CSV Data: {os.path.basename(file_path)}\n\n")
+        columns = None
+        row_count = 0
+        
+        # The pyarrow engine has no chunksize support, so use the default parser here
+        for chunk in pd.read_csv(file_path, chunksize=InternalConfig.csv_chunk_rows):
+            if columns is None:
+                columns = chunk.columns.tolist()
+            if chunk.empty:
+                continue
+            if not row_count:
+                buf.write("\n".join(self._markdown_header(columns)))
+            for row in self._markdown_rows(chunk):
+                buf.write("\n")
+                buf.write(row)
+            row_count += len(chunk)
+        
+        if not row_count:
+            buf.write("*No data available*")
+        
+        metadata = {
+            "row_count": row_count,
+            "column_count": len(columns or []),
+            "columns": columns or [],
+            "extractor": "pandas"
+        }
+        
+        return ConversionResult(buf.getvalue(), metadata)
+    
+    def _read_csv(self, file_path: str, pd):
+        """Read a CSV file, preferring the multithreaded pyarrow parser.
+        
+        Args:
+            file_path: Path to the CSV file to read
+            pd: pandas module reference
+            
+        Returns:
+            pandas DataFrame
+        """
+        try:
+            return pd.read_csv(file_path, engine="pyarrow")
+        except (ImportError, ValueError, TypeError) as e:
+            # pyarrow missing, or this pandas/pyarrow combination can't parse the file
+            logger.debug(f"pyarrow CSV engine unavailable, using default parser: {e}")
+            return pd.read_csv(file_path)
+    
     def _process_excel(self, file_path: str) -> ConversionResult:
         """Process an Excel file and return a conversion result.
         
@@ -107,8 +169,10 @@ class ExcelProcessor(BaseProcessor):
         try:
             import pandas as pd
             
+            # Open the workbook once; pandas' openpyxl reader is already read-only/data-only
             excel_file = pd.ExcelFile(file_path)
             sheet_names = excel_file.sheet_names
+            sheets = pd.read_excel(excel_file, sheet_name=None)
             
             metadata = {
                 "sheet_count": len(sheet_names),
@@ -116,18 +180,17 @@ class ExcelProcessor(BaseProcessor):
                 "extractor": "pandas"
             }
             
-            content_parts = []
+            buf = io.StringIO()
             
             for sheet_name in sheet_names:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = self._downcast_numeric(sheets[sheet_name], pd)
                 if not df.empty:
-                    content_parts.append(f"\n## Sheet: {sheet_name}")
-                    content_parts.append("")
+                    if buf.tell():
+                        buf.write("\n")
                     
                     # Convert DataFrame to markdown table
                     table_md = self._dataframe_to_markdown(df, pd)
-                    content_parts.append(table_md)
-                    content_parts.append("")
+                    buf.write(f"\n## Sheet: {sheet_name}\n\n{table_md}\n")
                     
                     # Add metadata for this sheet
                     metadata.update({
@@ -136,9 +199,7 @@ class ExcelProcessor(BaseProcessor):
                         f"sheet_{sheet_name}_columns_list": df.columns.tolist()
                     })
             
-            content = '\n'.join(content_parts)
-            
-            return ConversionResult(content, metadata)
+            return ConversionResult(buf.getvalue(), metadata)
             
         except ImportError:
             raise ConversionError("pandas and openpyxl are required for Excel processing. Install them with: pip install pandas openpyxl")
@@ -147,6 +208,25 @@ class ExcelProcessor(BaseProcessor):
                 raise
             raise ConversionError(f"Failed to process Excel file {file_path}: {str(e)}")
     
+    def _downcast_numeric(self, df, pd):
+        """Shrink integer columns to the smallest dtype that holds their values.
+        
+        Float columns are left alone since float32 would change how values print.
+        
+        Args:
+            df: pandas DataFrame
+            pd: pandas module reference
+            
+        Returns:
+            DataFrame with downcast integer columns
+        """
+        int_columns = df.select_dtypes(include="integer").columns
+        if len(int_columns):
+            df = df.copy()
+            for col in int_columns:
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+        return df
+    
     def _dataframe_to_markdown(self, df, pd) -> str:
         """Convert pandas DataFrame to markdown table.
         
@@ -161,24 +241,40 @@ class ExcelProcessor(BaseProcessor):
             return "*No data available*"
         
         # Convert DataFrame to markdown table
-        markdown_parts = []
-        
-        # Header
-        markdown_parts.append("| " + " | ".join(str(col) for col in df.columns) + " |")
-        markdown_parts.append("| " + " | ".join(["---"] * len(df.columns)) + " |")
+        markdown_parts = self._markdown_header(df.columns)
         
         # Data rows
-        for _, row in df.iterrows():
-            row_data = []
-            for cell in row:
-                if pd.isna(cell):
-                    row_data.append("")
-                else:
-                    row_data.append(str(cell))
-            markdown_parts.append("| " + " | ".join(row_data) + " |")
+        markdown_parts.extend(self._markdown_rows(df))
         
         return "\n".join(markdown_parts)
     
+    def _markdown_header(self, columns) -> list:
+        """Render the header and separator lines of a markdown table.
+        
+        Args:
+            columns: Column labels
+            
+        Returns:
+            List of markdown header strings
+        """
+        return [
+            "| " + " | ".join(str(col) for col in columns) + " |",
+            "| " + " | ".join(["---"] * len(columns)) + " |",
+        ]
+    
+    def _markdown_rows(self, df) -> list:
+        """Render DataFrame rows as markdown table lines.
+        
+        Args:
+            df: pandas DataFrame
+            
+        Returns:
+            List of markdown row strings
+        """
+        # Blank out missing values and stringify whole columns at once
+        cells = df.astype(object).where(df.notna(), "").astype(str).to_numpy()
+        return ["| " + " | ".join(row) + " |" for row in cells]
+    
     def _clean_content(self, content: str) -> str:
         """Clean up the extracted Excel content.
         
@@ -188,18 +284,8 @@ class ExcelProcessor(BaseProcessor):
         Returns:
             Cleaned text content
         """
-        # Remove excessive whitespace and normalize
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove excessive whitespace
-            line = ' '.join(line.split())
-            if line.strip():
-                cleaned_lines.append(line)
-        
-        # Join lines and add proper spacing
-        content = '\n'.join(cleaned_lines)
+        # Collapse whitespace within lines, then trim lines and drop blank ones
+        content = _LINE_BREAK_RE.sub('\n', _INLINE_WS_RE.sub(' ', content)).strip()
         
         # Add spacing around headers
         content = content.replace('# ', '\n# ')
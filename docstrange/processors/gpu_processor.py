@@ -3,13 +3,14 @@
 import os
 import json
 import logging
-import tempfile
+import queue
+import threading
 import re
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
 
 from .base import BaseProcessor
 from ..result import ConversionResult
+from ..config import InternalConfig
 from ..exceptions import ConversionError, FileNotFoundError
 from ..pipeline.ocr_service import OCRServiceFactory
 
@@ -102,6 +103,7 @@ class GPUConversionResult(ConversionResult):
         try:
             from PIL import Image
             from transformers import AutoTokenizer, AutoProcessor, AutoModelForImageTextToText
+            from ..pipeline.nanonets_processor import _inference_dtype
             
             # Get the model from the GPU processor's OCR service
             ocr_service = self.gpu_processor._get_ocr_service()
@@ -116,7 +118,7 @@ class GPUConversionResult(ConversionResult):
                 model_path = "nanonets/Nanonets-OCR-s"
                 model = AutoModelForImageTextToText.from_pretrained(
                     model_path, 
-                    torch_dtype="auto", 
+                    torch_dtype=_inference_dtype(), 
                     device_map="auto"
                 )
                 model.eval()
@@ -155,7 +157,7 @@ Example:
             messages = [
                 {"role": "system", "content": "You are a helpful assistant."},
                 {"role": "user", "content": [
-                    {"type": "image", "image": f"file://{self.file_path}"},
+                    {"type": "image"},
                     {"type": "text", "text": prompt},
                 ]},
             ]
@@ -167,7 +169,7 @@ Example:
             
             # Generate JSON response
             output_ids = model.generate(**inputs, max_new_tokens=15000, do_sample=False)
-            generated_ids = [output_ids[len(input_ids):] for input_ids, output_ids in zip(inputs.input_ids, output_ids)]
+            generated_ids = output_ids[:, inputs.input_ids.shape[1]:]
             
             json_text = processor.batch_decode(generated_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True)[0]
             print(f"json_text: {json_text}")
@@ -256,6 +258,8 @@ Example:
 class GPUProcessor(BaseProcessor):
     """Processor for image files and PDFs with Nanonets OCR capabilities."""
     
+    _SUPPORTED_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif', '.pdf'})
+    
     def __init__(self, preserve_layout: bool = True, include_images: bool = False, ocr_enabled: bool = True, use_markdownify: bool = None, ocr_service=None):
         super().__init__(preserve_layout, include_images, ocr_enabled, use_markdownify)
         self._ocr_service = ocr_service
@@ -269,20 +273,16 @@ class GPUProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif', '.pdf']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def _get_ocr_service(self):
         """Get OCR service instance."""
         if self._ocr_service is not None:
             return self._ocr_service
         # Use Nanonets OCR service by default
-        self._ocr_service = OCRServiceFactory.create_service('nanonets')
+        self._ocr_service = OCRServiceFactory.get_shared_service('nanonets')
         return self._ocr_service
     
     def process(self, file_path: str) -> GPUConversionResult:
@@ -300,7 +300,7 @@ class GPUProcessor(BaseProcessor):
             
             # Check file type
             file_path_str = str(file_path)
-            _, ext = os.path.splitext(file_path_str.lower())
+            ext = os.path.splitext(file_path_str)[1].lower()
             
             if ext == '.pdf':
                 logger.info(f"Processing PDF file: {file_path}")
@@ -326,7 +326,7 @@ class GPUProcessor(BaseProcessor):
         ocr_service = self._get_ocr_service()
         
         # Extract text with layout awareness if enabled
-        if self.ocr_enabled and self.preserve_layout:
+        if self.ocr_enabled and self.preserve_layout and InternalConfig.layout_ocr_enabled:
             logger.info("Extracting text with layout awareness using Nanonets OCR")
             extracted_text = ocr_service.extract_text_with_layout(file_path)
         elif self.ocr_enabled:
@@ -357,6 +357,9 @@ class GPUProcessor(BaseProcessor):
     def _process_pdf(self, file_path: str) -> GPUConversionResult:
         """Process PDF file by converting to images and using OCR.
         
+        Pages are rendered on a background thread while earlier pages are
+        being OCR'd, so rasterization overlaps with model inference.
+        
         Args:
             file_path: Path to the PDF file
             
@@ -364,64 +367,47 @@ class GPUProcessor(BaseProcessor):
             GPUConversionResult with extracted content
         """
         try:
-            # Convert PDF to images
-            image_paths = self._convert_pdf_to_images(file_path)
-            
-            if not image_paths:
-                logger.warning("No pages could be extracted from PDF")
-                return GPUConversionResult(
-                    content="",
-                    metadata={
-                        'file_path': file_path,
-                        'file_type': 'pdf',
-                        'ocr_enabled': self.ocr_enabled,
-                        'preserve_layout': self.preserve_layout,
-                        'ocr_provider': 'nanonets',
-                        'pages_processed': 0
-                    },
-                    gpu_processor=self,
-                    file_path=file_path,
-                    ocr_provider='nanonets'
-                )
-            
-            # Process each page with OCR
-            all_texts = []
             ocr_service = self._get_ocr_service()
             
-            for i, image_path in enumerate(image_paths):
-                logger.info(f"Processing PDF page {i+1}/{len(image_paths)}")
-                
+            # (text, error) for each page, in page order
+            page_results = []
+            for batch in self._iter_pdf_image_batches(file_path, InternalConfig.ocr_batch_size):
+                logger.info(f"Processing PDF pages {len(page_results)+1}-{len(page_results)+len(batch)}")
                 try:
-                    if self.ocr_enabled and self.preserve_layout:
-                        page_text = ocr_service.extract_text_with_layout(image_path)
+                    if self.ocr_enabled and self.preserve_layout and InternalConfig.layout_ocr_enabled:
+                        page_texts = ocr_service.extract_text_with_layout_batch(
+                            batch, batch_size=InternalConfig.ocr_batch_size
+                        )
                     elif self.ocr_enabled:
-                        page_text = ocr_service.extract_text(image_path)
+                        page_texts = [ocr_service.extract_text(image) for image in batch]
                     else:
-                        page_text = ""
-                    
-                    # Add page header and content if there's text
-                    if page_text.strip():
-                        # Add page header (markdown style)
-                        all_texts.append(f"\n## Page {i+1}\n\n")
-                        all_texts.append(page_text)
-                        
-                        # Add horizontal rule after content (except for last page)
-                        if i < len(image_paths) - 1:
-                            all_texts.append("\n\n---\n\n")
-                    
+                        page_texts = [""] * len(batch)
+                    page_results.extend((page_text, None) for page_text in page_texts)
                 except Exception as e:
-                    logger.error(f"Failed to process page {i+1}: {e}")
+                    logger.error(f"Failed to process pages {len(page_results)+1}-{len(page_results)+len(batch)}: {e}")
+                    page_results.extend(("", e) for _ in batch)
+            
+            if not page_results:
+                logger.warning("No pages could be extracted from PDF")
+            
+            page_count = len(page_results)
+            all_texts = []
+            for i, (page_text, page_error) in enumerate(page_results):
+                if page_error is not None:
                     # Add error page with markdown formatting
-                    all_texts.append(f"\n## Page {i+1}\n\n*Error processing this page: {e}*\n\n")
-                    if i < len(image_paths) - 1:
+                    all_texts.append(f"\n## Page {i+1}\n\n*Error processing this page: {page_error}*\n\n")
+                    if i < page_count - 1:
                         all_texts.append("---\n\n")
                 
-                finally:
-                    # Clean up temporary image file
-                    try:
-                        os.unlink(image_path)
-                    except:
-                        pass
+                # Add page header and content if there's text
+                elif page_text.strip():
+                    # Add page header (markdown style)
+                    all_texts.append(f"\n## Page {i+1}\n\n")
+                    all_texts.append(page_text)
+                    
+                    # Add horizontal rule after content (except for last page)
+                    if i < page_count - 1:
+                        all_texts.append("\n\n---\n\n")
             
             # Combine all page texts
             combined_text = ''.join(all_texts)
@@ -435,87 +421,143 @@ class GPUProcessor(BaseProcessor):
                     'ocr_enabled': self.ocr_enabled,
                     'preserve_layout': self.preserve_layout,
                     'ocr_provider': 'nanonets',
-                    'pages_processed': len(image_paths)
+                    'pages_processed': page_count
                 },
                 gpu_processor=self,
                 file_path=file_path,
                 ocr_provider='nanonets'
             )
             
-            logger.info(f"PDF processing completed. Processed {len(image_paths)} pages, extracted {len(combined_text)} characters")
+            logger.info(f"PDF processing completed. Processed {page_count} pages, extracted {len(combined_text)} characters")
             return result
             
         except Exception as e:
             logger.error(f"Failed to process PDF {file_path}: {e}")
             raise ConversionError(f"PDF processing failed: {e}")
     
-    def _convert_pdf_to_images(self, pdf_path: str) -> List[str]:
-        """Convert PDF pages to images.
+    def _iter_pdf_image_batches(self, pdf_path: str, batch_size: int) -> Iterator[List[Any]]:
+        """Render PDF pages on a background thread and yield them in batches.
+        
+        The renderer stays at most two batches ahead of the consumer.
         
         Args:
             pdf_path: Path to the PDF file
+            batch_size: Number of page images per batch
             
-        Returns:
-            List of paths to temporary image files
+        Yields:
+            Lists of in-memory RGB page images, in page order
         """
+        pages = queue.Queue(maxsize=batch_size * 2)
+        stop = threading.Event()
+        done = object()
+        
+        def render():
+            try:
+                for image in self._iter_pdf_page_images(pdf_path):
+                    while True:
+                        try:
+                            pages.put(image, timeout=0.1)
+                            break
+                        except queue.Full:
+                            if stop.is_set():
+                                return
+            except Exception as e:
+                pages.put(e)
+            finally:
+                pages.put(done)
+        
+        renderer = threading.Thread(target=render, name="pdf-page-renderer", daemon=True)
+        renderer.start()
+        
+        batch = []
         try:
-            import fitz  # PyMuPDF
+            while True:
+                item = pages.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                batch.append(item)
+                if len(batch) == batch_size:
+                    ready, batch = batch, []
+                    yield ready
+            if batch:
+                ready, batch = batch, []
+                yield ready
+        finally:
+            # On early exit, stop the renderer and drain the queue so it can finish
+            stop.set()
+            while renderer.is_alive() or not pages.empty():
+                try:
+                    pages.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+    
+    def _iter_pdf_page_images(self, pdf_path: str) -> Iterator[Any]:
+        """Render PDF pages to in-memory images one at a time.
+        
+        Args:
+            pdf_path: Path to the PDF file
             
+        Yields:
+            RGB PIL image of each page
+        """
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            logger.error("PyMuPDF (fitz) not available. Please install it: pip install PyMuPDF")
+            raise ConversionError("PyMuPDF is required for PDF processing")
+        
+        try:
+            from PIL import Image
+        except ImportError:
+            raise ConversionError("Pillow is required for PDF processing. Install it with: pip install Pillow")
+        
+        try:
             # Open the PDF
             pdf_document = fitz.open(pdf_path)
-            image_paths = []
-            
-            # Create temporary directory for images
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
+        except Exception as e:
+            logger.error(f"Failed to extract PDF to images: {e}")
+            raise ConversionError(f"PDF to image conversion failed: {e}")
+        
+        try:
+            # Convert each page to image
+            for page in pdf_document:
+                # Zoom for better OCR, capped so oversized pages don't explode the pixel count
+                zoom = min(
+                    InternalConfig.pdf_image_scale,
+                    InternalConfig.pdf_image_max_side / max(page.rect.width, page.rect.height, 1)
+                )
                 
-                # Convert each page to image
-                for page_num in range(len(pdf_document)):
-                    page = pdf_document.load_page(page_num)
-                    
-                    # Set zoom factor for better quality
-                    mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
-                    
-                    # Render page to image
-                    pix = page.get_pixmap(matrix=mat)
-                    
-                    # Save image
-                    image_path = temp_path / f"page_{page_num+1}.png"
-                    pix.save(str(image_path))
-                    
-                    # Copy to a persistent temporary file
-                    persistent_image_path = tempfile.mktemp(suffix='.png')
-                    import shutil
-                    shutil.copy2(str(image_path), persistent_image_path)
-                    
-                    image_paths.append(persistent_image_path)
+                # Render page to image
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
                 
-                pdf_document.close()
-            
-            logger.info(f"Converted PDF to {len(image_paths)} images")
-            return image_paths
-            
-        except ImportError:
-            logger.error("PyMuPDF (fitz) not available. Please install it: pip install PyMuPDF")
-            raise ConversionError("PyMuPDF is required for PDF processing")
+                # Wrap the raw RGB samples directly, skipping a PNG encode and decode
+                yield Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
         except Exception as e:
             logger.error(f"Failed to extract PDF to images: {e}")
             raise ConversionError(f"PDF to image conversion failed: {e}")
+        finally:
+            pdf_document.close()
     
     @staticmethod
-    def predownload_ocr_models():
-        """Pre-download OCR models by running a dummy prediction."""
+    def predownload_ocr_models(warmup_sizes=((1024, 1024), (800, 600))):
+        """Load the shared OCR models and warm them up with blank predictions.
+        
+        The warmed service is the one later handed out by
+        ``OCRServiceFactory.get_shared_service``, so the first real request
+        does not pay the model-load latency.
+        
+        Args:
+            warmup_sizes: (width, height) pairs to run one blank prediction at
+        """
         try:
             from docstrange.pipeline.ocr_service import OCRServiceFactory
-            ocr_service = OCRServiceFactory.create_service('nanonets')
-            # Create a blank image for testing
+            ocr_service = OCRServiceFactory.get_shared_service('nanonets')
+            # Run one blank in-memory image per size so shape-specific kernels get cached
             from PIL import Image
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                img = Image.new('RGB', (100, 100), color='white')
-                img.save(tmp.name)
-                ocr_service.extract_text_with_layout(tmp.name)
-                os.unlink(tmp.name)
+            for size in warmup_sizes:
+                ocr_service.extract_text_with_layout(Image.new('RGB', size, color='white'))
             print("Nanonets OCR models pre-downloaded and cached.")
         except Exception as e:
-            print(f"Failed to pre-download Nanonets OCR models: {e}") 
\ No newline at end of file
+            print(f"Failed to pre-download Nanonets OCR models: {e}")
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import os
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import BaseProcessor
 from ..result import ConversionResult
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 class HTMLProcessor(BaseProcessor):
     """Processor for HTML files using markdownify for conversion."""
     
+    _SUPPORTED_EXTS = frozenset({'.html', '.htm'})
+    
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -24,13 +26,9 @@ class HTMLProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.html', '.htm']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def process(self, file_path: str) -> ConversionResult:
         """Process the HTML file and return a conversion result.
@@ -49,17 +47,58 @@ class HTMLProcessor(BaseProcessor):
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            try:
-                from markdownify import markdownify as md
-            except ImportError:
-                raise ConversionError("markdownify is required for HTML processing. Install it with: pip install markdownify")
-
             metadata = self.get_metadata(file_path)
             with open(file_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
-            content = md(html_content, heading_style="ATX")
+            
+            content = None
+            if self.use_markdownify is False:
+                content = self._convert_with_html2text(html_content)
+            if content is None:
+                content = self._convert_with_markdownify(html_content)
             return ConversionResult(content, metadata)
         except Exception as e:
             if isinstance(e, (FileNotFoundError, ConversionError)):
                 raise
-            raise ConversionError(f"Failed to process HTML file {file_path}: {str(e)}") 
\ No newline at end of file
+            raise ConversionError(f"Failed to process HTML file {file_path}: {str(e)}") 
+    
+    def _convert_with_markdownify(self, html_content: str) -> str:
+        """Convert HTML to markdown with markdownify.
+        
+        Args:
+            html_content: HTML source
+            
+        Returns:
+            Markdown content
+        """
+        try:
+            from bs4 import BeautifulSoup, FeatureNotFound
+            from markdownify import MarkdownConverter
+        except ImportError:
+            raise ConversionError("markdownify is required for HTML processing. Install it with: pip install markdownify")
+        
+        # Parse with lxml (C parser) rather than markdownify's default html.parser
+        try:
+            soup = BeautifulSoup(html_content, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(html_content, 'html.parser')
+        return MarkdownConverter(heading_style="ATX").convert_soup(soup)
+    
+    def _convert_with_html2text(self, html_content: str) -> Optional[str]:
+        """Convert HTML to markdown with html2text, which skips building a DOM tree.
+        
+        Args:
+            html_content: HTML source
+            
+        Returns:
+            Markdown content, or None if html2text is not installed
+        """
+        try:
+            import html2text
+        except ImportError:
+            logger.debug("html2text not available, falling back to markdownify")
+            return None
+        
+        converter = html2text.HTML2Text()
+        converter.body_width = 0  # Don't hard-wrap lines
+        return converter.handle(html_content)
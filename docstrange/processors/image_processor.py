@@ -2,9 +2,10 @@
 
 import os
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from .base import BaseProcessor
+from ..config import InternalConfig
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 from ..pipeline.ocr_service import OCRServiceFactory
@@ -16,9 +17,13 @@ logger = logging.getLogger(__name__)
 class ImageProcessor(BaseProcessor):
     """Processor for image files (JPG, PNG, etc.) with OCR capabilities."""
     
-    def __init__(self, preserve_layout: bool = True, include_images: bool = False, ocr_enabled: bool = True, use_markdownify: bool = None, ocr_service=None):
+    _SUPPORTED_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif'})
+    
+    def __init__(self, preserve_layout: bool = True, include_images: bool = False, ocr_enabled: bool = True, use_markdownify: bool = None, ocr_service=None, ocr_provider: str = None):
         super().__init__(preserve_layout, include_images, ocr_enabled, use_markdownify)
         self._ocr_service = ocr_service
+        # Provider of the shared service to load on first use (defaults to config)
+        self._ocr_provider = ocr_provider
     
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
@@ -29,19 +34,15 @@ class ImageProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp', '.gif']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def _get_ocr_service(self):
         """Get OCR service instance."""
         if self._ocr_service is not None:
             return self._ocr_service
-        self._ocr_service = OCRServiceFactory.create_service()
+        self._ocr_service = OCRServiceFactory.get_shared_service(self._ocr_provider)
         return self._ocr_service
     
     def process(self, file_path: str) -> ConversionResult:
@@ -63,7 +64,7 @@ class ImageProcessor(BaseProcessor):
             ocr_service = self._get_ocr_service()
             
             # Extract text with layout awareness if enabled
-            if self.ocr_enabled and self.preserve_layout:
+            if self.ocr_enabled and self.preserve_layout and InternalConfig.layout_ocr_enabled:
                 logger.info("Extracting text with layout awareness")
                 extracted_text = ocr_service.extract_text_with_layout(file_path)
             elif self.ocr_enabled:
@@ -73,17 +74,7 @@ class ImageProcessor(BaseProcessor):
                 logger.warning("OCR is disabled, returning empty content")
                 extracted_text = ""
             
-            # Create result
-            result = ConversionResult(
-                content=extracted_text,
-                metadata={
-                    'file_path': file_path,
-                    'file_type': 'image',
-                    'ocr_enabled': self.ocr_enabled,
-                    'preserve_layout': self.preserve_layout
-                }
-            )
-            
+            result = self._build_result(file_path, extracted_text)
             logger.info(f"Image processing completed. Extracted {len(extracted_text)} characters")
             return result
             
@@ -91,20 +82,87 @@ class ImageProcessor(BaseProcessor):
             logger.error(f"Failed to process image file {file_path}: {e}")
             raise ConversionError(f"Image processing failed: {e}")
     
+    def process_many(self, file_paths: List[str]) -> List[ConversionResult]:
+        """Process several image files, letting the OCR service batch model calls.
+        
+        Args:
+            file_paths: Paths to the image files
+            
+        Returns:
+            One ConversionResult per file, in input order
+        """
+        try:
+            for file_path in file_paths:
+                if not os.path.exists(file_path):
+                    raise FileNotFoundError(f"Image file not found: {file_path}")
+            
+            logger.info(f"Processing {len(file_paths)} image files")
+            
+            extracted_texts = self.extract_texts(file_paths)
+            
+            return [
+                self._build_result(file_path, extracted_text)
+                for file_path, extracted_text in zip(file_paths, extracted_texts)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Failed to process image files: {e}")
+            raise ConversionError(f"Image processing failed: {e}")
+    
+    def extract_texts(self, images: List[Any]) -> List[str]:
+        """Run OCR over several images, letting the OCR service batch model calls.
+        
+        Args:
+            images: Image file paths, or decoded PIL images for services
+                that accept them (the built-in Nanonets and neural services do)
+            
+        Returns:
+            Extracted text for each image, in input order
+        """
+        if not self.ocr_enabled:
+            # No need to load the OCR models at all
+            logger.warning("OCR is disabled, returning empty content")
+            return [""] * len(images)
+        
+        # Get OCR service
+        ocr_service = self._get_ocr_service()
+        
+        if self.preserve_layout and InternalConfig.layout_ocr_enabled:
+            return ocr_service.extract_text_with_layout_batch(
+                images, batch_size=InternalConfig.ocr_batch_size
+            )
+        return [ocr_service.extract_text(image) for image in images]
+    
+    def _build_result(self, file_path: str, extracted_text: str) -> ConversionResult:
+        """Wrap extracted text in a ConversionResult with image metadata."""
+        return ConversionResult(
+            content=extracted_text,
+            metadata={
+                'file_path': file_path,
+                'file_type': 'image',
+                'ocr_enabled': self.ocr_enabled,
+                'preserve_layout': self.preserve_layout
+            }
+        )
+    
     @staticmethod
-    def predownload_ocr_models():
-        """Pre-download OCR models by running a dummy prediction."""
+    def predownload_ocr_models(warmup_sizes=((1024, 1024), (800, 600))):
+        """Load the shared OCR models and warm them up with blank predictions.
+        
+        The warmed service is the one later handed out by
+        ``OCRServiceFactory.get_shared_service``, so the first real request
+        does not pay the model-load latency.
+        
+        Args:
+            warmup_sizes: (width, height) pairs to run one blank prediction at
+        """
         try:
-            from docstrange.services.ocr_service import OCRServiceFactory
-            ocr_service = OCRServiceFactory.create_service()
-            # Create a blank image for testing
+            from docstrange.pipeline.ocr_service import OCRServiceFactory
+            ocr_service = OCRServiceFactory.get_shared_service()
+            # Run one blank in-memory image per size so shape-specific kernels get cached
             from PIL import Image
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                img = Image.new('RGB', (100, 100), color='white')
-                img.save(tmp.name)
-                ocr_service.extract_text_with_layout(tmp.name)
-                os.unlink(tmp.name)
+            for size in warmup_sizes:
+                ocr_service.extract_text_with_layout(Image.new('RGB', size, color='white'))
             print("OCR models pre-downloaded and cached.")
         except Exception as e:
-            print(f"Failed to pre-download OCR models: {e}") 
\ No newline at end of file
+            print(f"Failed to pre-download OCR models: {e}")
\ No newline at end of file
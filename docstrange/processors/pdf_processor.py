@@ -1,8 +1,9 @@
 """PDF file processor with OCR support for scanned PDFs."""
 
+import io
 import os
 import logging
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple
 
 from .base import BaseProcessor
@@ -10,7 +11,6 @@ from .image_processor import ImageProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 from ..config import InternalConfig
-from ..pipeline.ocr_service import OCRServiceFactory, NeuralOCRService
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -19,16 +19,17 @@ logger = logging.getLogger(__name__)
 class PDFProcessor(BaseProcessor):
     """Processor for PDF files using PDF-to-image conversion with OCR."""
     
+    _SUPPORTED_EXTS = frozenset({'.pdf'})
+    
     def __init__(self, preserve_layout: bool = True, include_images: bool = False, ocr_enabled: bool = True, use_markdownify: bool = None):
         super().__init__(preserve_layout, include_images, ocr_enabled, use_markdownify)
-        # Create a shared OCR service instance for all pages
-        shared_ocr_service = NeuralOCRService()
+        # All pages use the shared neural OCR service, loaded on the first OCR'd PDF
         self._image_processor = ImageProcessor(
             preserve_layout=preserve_layout,
             include_images=include_images,
             ocr_enabled=ocr_enabled,
             use_markdownify=use_markdownify,
-            ocr_service=shared_ocr_service
+            ocr_provider='neural'
         )
     
     def can_process(self, file_path: str) -> bool:
@@ -40,13 +41,9 @@ class PDFProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext == '.pdf'
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def process(self, file_path: str) -> ConversionResult:
         """Process PDF file with OCR capabilities.
@@ -79,38 +76,51 @@ class PDFProcessor(BaseProcessor):
             
             logger.info("pdf_to_image_enabled is False: trying direct text extraction first")
             # Otherwise, try to extract text directly first (smart logic)
+            page_count = 0
+            page_texts = []
+            scanned_pages = set()
             try:
                 import fitz  # PyMuPDF
                 
                 doc = fitz.open(file_path)
-                text_content = []
-                page_count = len(doc)  # Store page count
-                
                 try:
+                    page_count = len(doc)  # Store page count
                     for page_num in range(page_count):
                         page = doc.load_page(page_num)
                         text = page.get_text()
-                        if text.strip():
-                            text_content.append(text)
-                    
-                    # If we got substantial text, use it
-                    if text_content and any(len(text.strip()) > 50 for text in text_content):
-                        logger.info("PDF contains extractable text, using direct extraction")
-                        content = "\n\n".join(text_content)
-                        return ConversionResult(
-                            content=content,
-                            metadata={
-                                'file_path': file_path,
-                                'file_type': 'pdf',
-                                'pages': len(text_content),
-                                'extraction_method': 'direct'
-                            }
-                        )
+                        page_texts.append(text)
+                        # A page with little text only needs OCR if it has an image to read
+                        if len(text.strip()) <= 50 and page.get_images():
+                            scanned_pages.add(page_num)
                 finally:
                     doc.close()
-                
             except Exception as e:
                 logger.warning(f"Direct text extraction failed: {e}")
+                page_texts = []
+            
+            if any(len(text.strip()) > 50 for text in page_texts):
+                # No scanned pages: the text layer covers the whole document
+                if not scanned_pages:
+                    logger.info("PDF contains extractable text, using direct extraction")
+                    content = "\n\n".join(text for text in page_texts if text.strip())
+                    return ConversionResult(
+                        content=content,
+                        metadata={
+                            'file_path': file_path,
+                            'file_type': 'pdf',
+                            'pages': page_count,
+                            'extraction_method': 'direct'
+                        }
+                    )
+                
+                # Mixed PDF: keep the text layer where there is one and OCR only the scanned pages
+                native_text = {
+                    page_num: text.strip()
+                    for page_num, text in enumerate(page_texts)
+                    if page_num not in scanned_pages
+                }
+                logger.info(f"Using OCR for the {len(scanned_pages)} scanned pages without extractable text")
+                return self._process_with_ocr(file_path, native_text)
             
             # Fallback to OCR-based processing (for scanned PDFs or insufficient text)
             logger.info("Using OCR-based PDF processing (scanned PDF or insufficient text)")
@@ -120,47 +130,65 @@ class PDFProcessor(BaseProcessor):
             logger.error(f"Failed to process PDF file {file_path}: {e}")
             raise ConversionError(f"PDF processing failed: {e}")
     
-    def _process_with_ocr(self, file_path: str) -> ConversionResult:
-        """Process PDF using OCR after converting pages to images."""
+    def _process_with_ocr(self, file_path: str, native_text: Dict[int, str] = None) -> ConversionResult:
+        """Process PDF using OCR after converting pages to images.
+        
+        Pages are OCR'd in batches of InternalConfig.ocr_batch_size while the
+        next batch is rendered on a worker thread, so rasterization overlaps
+        with model inference.
+        
+        Args:
+            file_path: Path to the PDF file
+            native_text: Already extracted text by page number (0-based);
+                these pages are not rendered or OCR'd
+            
+        Returns:
+            ConversionResult with one section per non-empty page
+        """
         doc = None
         try:
             import fitz  # PyMuPDF
-            from PIL import Image
-            import io
             
             doc = fitz.open(file_path)
-            all_content = []
             page_count = len(doc)  # Store page count before processing
+            page_contents = dict(native_text or {})
             
-            for page_num in range(page_count):
-                page = doc.load_page(page_num)
-                
-                # Convert page to image
-                mat = fitz.Matrix(2, 2)  # Scale factor for better OCR
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Convert to PIL Image
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Save to temporary file for OCR processing
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    img.save(tmp.name)
-                    temp_image_path = tmp.name
-                
+            batch_size = max(1, InternalConfig.ocr_batch_size)
+            ocr_page_nums = [page_num for page_num in range(page_count) if page_num not in page_contents]
+            batches = [
+                ocr_page_nums[start:start + batch_size]
+                for start in range(0, len(ocr_page_nums), batch_size)
+            ]
+            
+            # Only the renderer thread touches the document while it is running
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-page-renderer") as renderer:
+                pending = renderer.submit(self._render_pages, doc, batches[0]) if batches else None
                 try:
-                    # Process the page image
-                    page_result = self._image_processor.process(temp_image_path)
-                    page_content = page_result.content
-                    
-                    if page_content.strip():
-                        all_content.append(f"## Page {page_num + 1}\n\n{page_content}")
-                    
+                    for i, page_nums in enumerate(batches):
+                        rendered = pending.result()
+                        pending = None
+                        if i + 1 < len(batches):
+                            pending = renderer.submit(self._render_pages, doc, batches[i + 1])
+                        
+                        # Process the page images
+                        page_texts = self._image_processor.extract_texts([img for _, img in rendered])
+                        
+                        for (page_num, _), page_content in zip(rendered, page_texts):
+                            page_contents[page_num] = page_content
                 finally:
-                    # Clean up temporary file
-                    os.unlink(temp_image_path)
+                    # On failure, stop waiting on the batch that was rendered ahead
+                    if pending is not None:
+                        pending.cancel()
+            
+            buf = io.StringIO()
+            for page_num in sorted(page_contents):
+                page_content = page_contents[page_num]
+                if page_content.strip():
+                    if buf.tell():
+                        buf.write("\n\n")
+                    buf.write(f"## Page {page_num + 1}\n\n{page_content}")
             
-            content = "\n\n".join(all_content) if all_content else "No content extracted from PDF"
+            content = buf.getvalue() or "No content extracted from PDF"
             
             return ConversionResult(
                 content=content,
@@ -168,7 +196,7 @@ class PDFProcessor(BaseProcessor):
                     'file_path': file_path,
                     'file_type': 'pdf',
                     'pages': page_count,  # Use stored page count
-                    'extraction_method': 'ocr'
+                    'extraction_method': 'hybrid' if native_text else 'ocr'
                 }
             )
             
@@ -182,109 +210,67 @@ class PDFProcessor(BaseProcessor):
                 except Exception as e:
                     logger.warning(f"Failed to close PDF document: {e}")
     
-    def _convert_page_to_image(self, doc, page_num: int) -> str:
-        """Convert a PDF page to an image file.
+    def _render_pages(self, doc, page_nums) -> List[Tuple[int, Any]]:
+        """Render a run of PDF pages to in-memory images.
         
         Args:
             doc: PyMuPDF document object
-            page_num: Page number (0-based)
+            page_nums: Page numbers (0-based) to render
             
         Returns:
-            Path to the temporary image file
+            (page_num, PIL image) pairs for the pages that rendered
         """
-        try:
-            import fitz  # PyMuPDF
-            
-            page = doc.load_page(page_num)
-            
-            # Use configuration for image quality
-            dpi = getattr(InternalConfig, 'pdf_image_dpi', 300)
-            scale = getattr(InternalConfig, 'pdf_image_scale', 2.0)
-            
-            # Calculate matrix for desired DPI
-            mat = fitz.Matrix(scale, scale)
-            
-            # Convert page to pixmap
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                pix.save(tmp_file.name)
-                logger.debug(f"Page {page_num + 1} converted to image: {tmp_file.name}")
-                return tmp_file.name
-                
-        except Exception as e:
-            logger.error(f"Failed to extract page {page_num + 1} to image: {e}")
-            return None
+        import fitz  # PyMuPDF
+        
+        rendered = []
+        for page_num in page_nums:
+            img = self._convert_page_to_pil(doc, page_num)
+            if img is not None:
+                rendered.append((page_num, img))
+        
+        # Empty MuPDF's resource store so memory stays flat on long scanned documents
+        fitz.TOOLS.store_shrink(100)
+        return rendered
     
-    def _extract_ocr_text_from_result(self, result: ConversionResult) -> str:
-        """Extract OCR text from ImageProcessor result.
+    def _convert_page_to_pil(self, doc, page_num: int):
+        """Convert a PDF page to a PIL image without going through an image file.
         
         Args:
-            result: ConversionResult from ImageProcessor
+            doc: PyMuPDF document object
+            page_num: Page number (0-based)
             
         Returns:
-            Extracted OCR text
+            RGB PIL image, or None if the page could not be rendered
         """
         try:
-            content = result.content
+            import fitz  # PyMuPDF
+            from PIL import Image
+            
+            page = doc.load_page(page_num)
             
-            # Look for OCR section in the content
-            if "## Extracted Text (OCR)" in content:
-                # Extract text after the OCR header
-                parts = content.split("## Extracted Text (OCR)")
-                if len(parts) > 1:
-                    ocr_section = parts[1]
-                    # Remove any remaining headers and clean up
-                    lines = ocr_section.split('\n')
-                    text_lines = []
-                    in_ocr_text = False
-                    
-                    for line in lines:
-                        if line.strip() == "":
-                            continue
-                        elif line.startswith("##"):
-                            # Stop at next header
-                            break
-                        else:
-                            text_lines.append(line)
-                    
-                    return '\n'.join(text_lines).strip()
+            # Zoom for better OCR, capped so oversized pages don't explode the pixel count
+            scale = min(
+                InternalConfig.pdf_image_scale,
+                InternalConfig.pdf_image_max_side / max(page.rect.width, page.rect.height, 1)
+            )
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
             
-            # If no OCR section found, return the full content
-            return content
+            # Wrap the raw RGB samples directly, skipping a PNG encode and decode
+            return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
             
         except Exception as e:
-            logger.error(f"Failed to extract OCR text from result: {e}")
-            return ""
+            logger.error(f"Failed to render page {page_num + 1}: {e}")
+            return None
     
-    def _format_page_content(self, text: str, page_num: int) -> str:
-        """Format page content as markdown with enhanced structure.
+    @staticmethod
+    def predownload_ocr_models(warmup_sizes=((1024, 1024), (800, 600))):
+        """Load and warm up the shared OCR models.
         
         Args:
-            text: Extracted text
-            page_num: Page number
-            
-        Returns:
-            Formatted markdown content
+            warmup_sizes: (width, height) pairs to run one blank prediction at
         """
-        if not text.strip():
-            return f"\n## Page {page_num}\n\n*This page appears to be empty or contains no extractable text.*\n"
-        
-        # The text from nanonets-ocr already has proper markdown structure
-        # Just add page header
-        content_parts = [f"## Page {page_num}"]
-        content_parts.append("")
-        content_parts.append(text)
-        content_parts.append("")
-        
-        return '\n'.join(content_parts)
-    
-    @staticmethod
-    def predownload_ocr_models():
-        """Pre-download OCR models by running a dummy prediction."""
         try:
             # Use ImageProcessor's predownload method
-            ImageProcessor.predownload_ocr_models()
+            ImageProcessor.predownload_ocr_models(warmup_sizes)
         except Exception as e:
             print(f"Failed to pre-download OCR models: {e}") 
\ No newline at end of file
@@ -1,13 +1,21 @@
 """PowerPoint file processor."""
 
+import io
 import os
 import logging
+import re
 from typing import Dict, Any
 
 from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 
+# Runs of whitespace other than newlines
+_INLINE_WS_RE = re.compile(r'[^\S\n]+')
+
+# A line break together with surrounding spaces and any blank lines after it
+_LINE_BREAK_RE = re.compile(r' *\n[ \n]*')
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -15,6 +23,8 @@ logger = logging.getLogger(__name__)
 class PPTXProcessor(BaseProcessor):
     """Processor for PowerPoint files (PPT, PPTX)."""
     
+    _SUPPORTED_EXTS = frozenset({'.ppt', '.pptx'})
+    
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -24,13 +34,9 @@ class PPTXProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.ppt', '.pptx']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def process(self, file_path: str) -> ConversionResult:
         """Process the PowerPoint file and return a conversion result.
@@ -57,7 +63,7 @@ class PPTXProcessor(BaseProcessor):
         
         # Check file extension to determine processing method
         file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
+        ext = os.path.splitext(file_path_str)[1].lower()
         
         if ext == '.ppt':
             return self._process_ppt_file(file_path, metadata)
@@ -92,7 +98,7 @@ class PPTXProcessor(BaseProcessor):
         try:
             from pptx import Presentation
             
-            content_parts = []
+            buf = io.StringIO()
             prs = Presentation(file_path)
             
             metadata.update({
@@ -106,22 +112,18 @@ class PPTXProcessor(BaseProcessor):
             
             for slide_num, slide in enumerate(prs.slides, 1):
                 if preserve_layout:
-                    content_parts.append(f"\n## Slide {slide_num}\n")
-                
-                slide_content = []
+                    buf.write(f"\n## Slide {slide_num}\n\n")
                 
                 for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        slide_content.append(shape.text.strip())
-                
-                if slide_content:
-                    content_parts.extend(slide_content)
-                    content_parts.append("")  # Add spacing between slides
-            
-            content = "\n\n".join(content_parts)
+                    # has_text_frame is a plain flag; hasattr() would go through AttributeError
+                    if shape.has_text_frame:
+                        text = shape.text_frame.text.strip()
+                        if text:
+                            buf.write(text)
+                            buf.write("\n\n")
             
-            # Clean up the content
-            content = self._clean_content(content)
+            # Clean up the content (this also folds the blank lines between parts)
+            content = self._clean_content(buf.getvalue())
             
             return ConversionResult(content, metadata)
             
@@ -141,18 +143,8 @@ class PPTXProcessor(BaseProcessor):
         Returns:
             Cleaned text content
         """
-        # Remove excessive whitespace and normalize
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove excessive whitespace
-            line = ' '.join(line.split())
-            if line.strip():
-                cleaned_lines.append(line)
-        
-        # Join lines and add proper spacing
-        content = '\n'.join(cleaned_lines)
+        # Collapse whitespace within lines, then trim lines and drop blank ones
+        content = _LINE_BREAK_RE.sub('\n', _INLINE_WS_RE.sub(' ', content))
         
         # Add spacing around headers
         content = content.replace('## Slide', '\n## Slide')
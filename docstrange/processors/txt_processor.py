@@ -1,6 +1,8 @@
 """Text file processor."""
 
+import codecs
 import os
+import re
 from typing import Dict, Any
 
 from .base import BaseProcessor
@@ -8,9 +10,24 @@ from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 
 
+# Byte-order marks that pin down the encoding; UTF-32 LE must be checked before UTF-16 LE
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Whitespace at the end of each line
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+
 class TXTProcessor(BaseProcessor):
     """Processor for plain text files."""
     
+    _SUPPORTED_EXTS = frozenset({'.txt', '.text'})
+    
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -20,13 +37,9 @@ class TXTProcessor(BaseProcessor):
         Returns:
             True if this processor can handle the file
         """
-        if not os.path.exists(file_path):
-            return False
-        
-        # Check file extension - ensure file_path is a string
-        file_path_str = str(file_path)
-        _, ext = os.path.splitext(file_path_str.lower())
-        return ext in ['.txt', '.text']
+        # Check file extension first - ensure file_path is a string
+        ext = os.path.splitext(str(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTS and os.path.exists(file_path)
     
     def process(self, file_path: str) -> ConversionResult:
         """Process the text file and return a conversion result.
@@ -45,14 +58,21 @@ class TXTProcessor(BaseProcessor):
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            # Try different encodings
+            # Read the bytes once and try each encoding on them
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            
+            # A byte-order mark settles the encoding without trial decodes
             encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            content = None
+            for bom, bom_encoding in _BOM_ENCODINGS:
+                if data.startswith(bom):
+                    encodings = [bom_encoding]
+                    break
             
+            content = None
             for encoding in encodings:
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
+                    content = data.decode(encoding)
                     break
                 except UnicodeDecodeError:
                     continue
@@ -60,6 +80,9 @@ class TXTProcessor(BaseProcessor):
             if content is None:
                 raise ConversionError(f"Could not decode file {file_path} with any supported encoding")
             
+            # Normalize line endings the way text-mode open() would
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+            
             # Clean up the content
             content = self._clean_content(content)
             
@@ -86,20 +109,8 @@ class TXTProcessor(BaseProcessor):
         Returns:
             Cleaned text content
         """
-        # Remove excessive whitespace
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove trailing whitespace
-            line = line.rstrip()
-            cleaned_lines.append(line)
+        # Remove trailing whitespace from every line
+        content = _TRAILING_WS_RE.sub('', content)
         
         # Remove empty lines at the beginning and end
-        while cleaned_lines and not cleaned_lines[0].strip():
-            cleaned_lines.pop(0)
-        
-        while cleaned_lines and not cleaned_lines[-1].strip():
-            cleaned_lines.pop()
-        
-        return '\n'.join(cleaned_lines) 
\ No newline at end of file
+        return content.strip('\n') 
\ No newline at end of file
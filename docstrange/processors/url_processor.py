@@ -1,15 +1,50 @@
 """URL processor for handling web pages and file downloads."""
 
+import functools
 import os
 import re
 import tempfile
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
 
 from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, NetworkError
 
+# Runs of whitespace other than newlines
+_INLINE_WS_RE = re.compile(r'[^\S\n]+')
+
+# A line break together with surrounding spaces and any blank lines after it
+_LINE_BREAK_RE = re.compile(r' *\n[ \n]*')
+
+# CSS selectors tried in order to locate the main content of a web page
+_MAIN_SELECTORS = (
+    'main',
+    '[role="main"]',
+    '.main-content',
+    '.content',
+    '#content',
+    'article',
+    '.post-content',
+    '.entry-content'
+)
+
+# Tags BeautifulSoup keeps when parsing a page: the title and anything that can hold the content
+_PARSED_TAGS = ['title', 'body', 'main', 'article', 'section', 'div']
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_main_selectors():
+    """Compile _MAIN_SELECTORS with soupsieve once per process.
+    
+    Returns:
+        The combined selector, and each selector in priority order
+    """
+    import soupsieve
+    
+    combined = soupsieve.compile(', '.join(_MAIN_SELECTORS))
+    return combined, tuple(soupsieve.compile(selector) for selector in _MAIN_SELECTORS)
+
 
 class URLProcessor(BaseProcessor):
     """Processor for URLs and web pages."""
@@ -234,7 +269,6 @@ class URLProcessor(BaseProcessor):
             ConversionResult containing the processed content
         """
         try:
-            from bs4 import BeautifulSoup
             import requests
             
             # Fetch the web page
@@ -245,30 +279,11 @@ class URLProcessor(BaseProcessor):
             response = requests.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
-            # Parse the HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Extract text content
-            content_parts = []
-            
-            # Get title
-            title = soup.find('title')
-            if title:
-                content_parts.append(f"# {title.get_text().strip()}\n")
-            
-            # Get main content
-            main_content = self._extract_main_content(soup)
-            if main_content:
-                content_parts.append(main_content)
-            else:
-                # Fallback to body text
-                body = soup.find('body')
-                if body:
-                    content_parts.append(body.get_text())
+            # Extract text content, using selectolax's C parser when it is installed
+            try:
+                content_parts = self._extract_text_selectolax(response.content)
+            except ImportError:
+                content_parts = self._extract_text_bs4(response.content)
             
             content = '\n'.join(content_parts)
             
@@ -303,6 +318,90 @@ class URLProcessor(BaseProcessor):
         except:
             return False
     
+    def _extract_text_selectolax(self, html: bytes) -> List[str]:
+        """Extract title and main text from HTML using selectolax.
+        
+        Args:
+            html: Raw HTML content
+            
+        Returns:
+            List of content parts
+            
+        Raises:
+            ImportError: If selectolax is not installed
+        """
+        from selectolax.parser import HTMLParser
+        
+        tree = HTMLParser(html)
+        
+        # Remove script and style elements
+        for node in tree.css('script, style'):
+            node.decompose()
+        
+        content_parts = []
+        
+        # Get title
+        title = tree.css_first('title')
+        if title:
+            content_parts.append(f"# {title.text().strip()}\n")
+        
+        # Get main content
+        for selector in _MAIN_SELECTORS:
+            element = tree.css_first(selector)
+            if element:
+                content_parts.append(element.text())
+                break
+        else:
+            # Fallback to body text
+            if tree.body:
+                content_parts.append(tree.body.text())
+        
+        return content_parts
+    
+    def _extract_text_bs4(self, html: bytes) -> List[str]:
+        """Extract title and main text from HTML using BeautifulSoup.
+        
+        Args:
+            html: Raw HTML content
+            
+        Returns:
+            List of content parts
+        """
+        from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+        
+        # Only build the parts of the tree we read; <head> (meta, links, inline
+        # scripts) is dropped. Content tags are listed for pages without a <body>.
+        strainer = SoupStrainer(_PARSED_TAGS)
+        
+        # Parse with lxml (C parser), falling back to the pure-Python html.parser
+        try:
+            soup = BeautifulSoup(html, 'lxml', parse_only=strainer)
+        except FeatureNotFound:
+            soup = BeautifulSoup(html, 'html.parser', parse_only=strainer)
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        content_parts = []
+        
+        # Get title
+        title = soup.find('title')
+        if title:
+            content_parts.append(f"# {title.get_text().strip()}\n")
+        
+        # Get main content
+        main_content = self._extract_main_content(soup)
+        if main_content:
+            content_parts.append(main_content)
+        else:
+            # Fallback to body text
+            body = soup.find('body')
+            if body:
+                content_parts.append(body.get_text())
+        
+        return content_parts
+    
     def _extract_main_content(self, soup) -> str:
         """Extract main content from the HTML.
         
@@ -312,22 +411,14 @@ class URLProcessor(BaseProcessor):
         Returns:
             Extracted main content
         """
-        # Try to find main content areas
-        main_selectors = [
-            'main',
-            '[role="main"]',
-            '.main-content',
-            '.content',
-            '#content',
-            'article',
-            '.post-content',
-            '.entry-content'
-        ]
+        combined, selectors = _compiled_main_selectors()
         
-        for selector in main_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text()
+        # Collect every candidate in one traversal, then honour selector priority
+        candidates = combined.select(soup)
+        for selector in selectors:
+            for element in candidates:
+                if selector.match(element):
+                    return element.get_text()
         
         # If no main content found, return empty string
         return ""
@@ -341,18 +432,8 @@ class URLProcessor(BaseProcessor):
         Returns:
             Cleaned text content
         """
-        # Remove excessive whitespace and normalize
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove excessive whitespace
-            line = ' '.join(line.split())
-            if line.strip():
-                cleaned_lines.append(line)
-        
-        # Join lines and add proper spacing
-        content = '\n'.join(cleaned_lines)
+        # Collapse whitespace within lines, then trim lines and drop blank ones
+        content = _LINE_BREAK_RE.sub('\n', _INLINE_WS_RE.sub(' ', content)).strip()
         
         # Add spacing around headers
         content = content.replace('# ', '\n# ')
@@ -416,7 +416,9 @@ class MarkdownToHTMLConverter:
             lang_class = f' class="language-{language}"' if language else ''
             return f'<pre><code{lang_class}>{self._escape_html(code)}</code></pre>'
         
-        text = re.sub(r'```(\w+)?\n(.*?)\n```', replace_code_block, text, flags=re.DOTALL)
+        # Skip the DOTALL scan entirely when there is no fence to match
+        if '```' in text:
+            text = re.sub(r'```(\w+)?\n(.*?)\n```', replace_code_block, text, flags=re.DOTALL)
         
         # Handle indented code blocks (4 spaces or tab)
         lines = text.split('\n')
@@ -448,6 +450,10 @@ class MarkdownToHTMLConverter:
     
     def _process_tables(self, text: str) -> str:
         """Process markdown tables."""
+        # Every table line contains a pipe, so text without one has nothing to convert
+        if '|' not in text:
+            return text
+        
         lines = text.split('\n')
         result_lines = []
         i = 0
@@ -113,10 +113,10 @@ def extract_document():
             else:
                 return jsonify({'error': str(e)}), 400
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp_file:
-            file.save(tmp_file.name)
-            tmp_path = tmp_file.name
+        # Save uploaded file temporarily (closed first, so Windows lets us reopen it)
+        fd, tmp_path = tempfile.mkstemp(suffix=Path(file.filename).suffix)
+        os.close(fd)
+        file.save(tmp_path)
         
         try:
             # Extract content
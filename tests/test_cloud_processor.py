@@ -0,0 +1,245 @@
+"""Tests for the cloud processor."""
+
+import asyncio
+import io
+import os
+import time
+from unittest import mock
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from docstrange.processors.cloud_processor import CloudProcessor
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "invoice.pdf"
+    path.write_bytes(b"%PDF-1.4 test document")
+    return str(path)
+
+
+@pytest.fixture
+def documents(tmp_path):
+    paths = []
+    for name in ("c.pdf", "a.pdf", "b.pdf"):
+        path = tmp_path / name
+        path.write_bytes(f"%PDF-1.4 {name}".encode("utf-8"))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def processor(tmp_path):
+    return CloudProcessor(cache_enabled=True, cache_dir=str(tmp_path / "cache"))
+
+
+class TestCloudDiskCache:
+    """Test cases for the on-disk cloud response cache."""
+
+    def test_miss_returns_none(self, processor, document):
+        result = processor.process(document)
+
+        assert result._read_disk_cache("markdown") is None
+
+    def test_hit_returns_written_content(self, processor, document, tmp_path):
+        processor.process(document)._write_disk_cache("markdown", "# Invoice")
+
+        # A fresh result for the same file content is served from disk
+        result = processor.process(document)
+        assert result._read_disk_cache("markdown") == "# Invoice"
+        assert (tmp_path / "cache") in result._disk_cache_path("markdown").parents
+
+    def test_entries_are_keyed_by_request(self, processor, document):
+        result = processor.process(document)
+        result._write_disk_cache("markdown", "# Invoice")
+
+        assert result._read_disk_cache("html") is None
+
+    def test_expired_entry_is_ignored(self, processor, document):
+        from docstrange.config import InternalConfig
+
+        result = processor.process(document)
+        result._write_disk_cache("markdown", "# Invoice")
+        cache_path = result._disk_cache_path("markdown")
+        stale = time.time() - InternalConfig.cloud_cache_ttl - 60
+        os.utime(cache_path, (stale, stale))
+
+        assert result._read_disk_cache("markdown") is None
+
+    def test_corrupt_entry_is_ignored(self, processor, document):
+        result = processor.process(document)
+        cache_path = result._disk_cache_path("markdown")
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json", encoding="utf-8")
+
+        assert result._read_disk_cache("markdown") is None
+
+    def test_disabled_cache_writes_nothing(self, document, tmp_path):
+        processor = CloudProcessor(cache_enabled=False, cache_dir=str(tmp_path / "cache"))
+        result = processor.process(document)
+        result._write_disk_cache("markdown", "# Invoice")
+
+        assert not (tmp_path / "cache").exists()
+        assert result._read_disk_cache("markdown") is None
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager."""
+
+    status = 200
+
+    def __init__(self, body):
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self._body
+
+
+class TestCloudAsyncProcess:
+    """Test cases for CloudProcessor.aprocess."""
+
+    def _session(self, content):
+        session = mock.MagicMock()
+        session.post.return_value = _FakeResponse(('{"content": "%s"}' % content).encode("utf-8"))
+        return session
+
+    def test_sends_fields_and_caches_under_request_key(self, processor, document):
+        pytest.importorskip("aiohttp")
+        session = self._session("total: 42")
+
+        with mock.patch.object(processor, "_build_form_data", wraps=processor._build_form_data) as build_form_data, \
+                mock.patch.object(processor, "_post", side_effect=AssertionError("unexpected sync upload")):
+            result = asyncio.run(processor.aprocess(
+                document, "specified-fields", session, specified_fields=["total"]
+            ))
+
+            build_form_data.assert_called_once_with("specified-fields", ["total"], None)
+            assert result._get_cloud_output("specified-fields", specified_fields=["total"]) == "total: 42"
+
+    def test_reuses_disk_cache(self, processor, document):
+        pytest.importorskip("aiohttp")
+        first = self._session("# Invoice")
+        asyncio.run(processor.aprocess(document, "markdown", first))
+
+        second = self._session("# Changed")
+        result = asyncio.run(processor.aprocess(document, "markdown", second))
+
+        assert first.post.call_count == 1
+        second.post.assert_not_called()
+        assert result.extract_markdown() == "# Invoice"
+
+
+class TestCloudBatchProcessing:
+    """Test cases for CloudProcessor.process_many and CloudConversionResult.prefetch."""
+
+    @staticmethod
+    def _fake_post(file_path, output_type, specified_fields=None, json_schema=None):
+        return f"{output_type}:{os.path.basename(file_path)}"
+
+    def test_process_many_prefetches_in_input_order(self, documents):
+        processor = CloudProcessor(cache_enabled=False)
+
+        with mock.patch.object(processor, "_post", side_effect=self._fake_post) as post:
+            results = processor.process_many(documents, "markdown")
+
+            assert [result.file_path for result in results] == documents
+            assert post.call_count == len(documents)
+            # Exports are served from the prefetched output without another upload
+            assert [result.extract_markdown() for result in results] == [
+                f"markdown:{os.path.basename(path)}" for path in documents
+            ]
+            assert post.call_count == len(documents)
+
+    def test_process_many_with_no_files(self):
+        processor = CloudProcessor(cache_enabled=False)
+
+        with mock.patch.object(processor, "_post") as post:
+            assert processor.process_many([]) == []
+            post.assert_not_called()
+
+    def test_prefetch_fetches_each_output_type_once(self, document):
+        processor = CloudProcessor(cache_enabled=False)
+        result = processor.process(document)
+
+        with mock.patch.object(processor, "_post", side_effect=self._fake_post) as post:
+            result.prefetch(["markdown", "html"])
+
+            assert sorted(call.args[1] for call in post.call_args_list) == ["html", "markdown"]
+            assert result.extract_markdown() == "markdown:invoice.pdf"
+            assert result.extract_html() == "html:invoice.pdf"
+            assert post.call_count == 2
+
+
+class _StatusAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter that answers with a fixed sequence of status codes."""
+
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = list(statuses)
+        self.bodies = []
+
+    def send(self, request, **kwargs):
+        body = request.body
+        self.bodies.append(body.read() if hasattr(body, "read") else body)
+
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        response = requests.models.Response()
+        response.status_code = status
+        response.raw = io.BytesIO(b'{"content": "# Invoice"}' if status == 200 else b'{}')
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class TestCloudUploadRetries:
+    """Test cases for retrying uploads on gateway errors."""
+
+    def _processor(self, statuses):
+        processor = CloudProcessor(cache_enabled=False)
+        adapter = _StatusAdapter(statuses)
+        processor._session.mount("https://", adapter)
+        return processor, adapter
+
+    def test_gateway_errors_are_retried_with_the_full_body(self, document):
+        processor, adapter = self._processor([503, 502, 200])
+
+        with mock.patch("docstrange.processors.cloud_processor.time.sleep") as sleep:
+            content = processor._post(document, "markdown")
+
+        assert content == "# Invoice"
+        assert len(adapter.bodies) == 3
+        assert sleep.call_count == 2
+        # Every attempt re-sends the whole file, not an exhausted stream
+        for body in adapter.bodies:
+            assert b"%PDF-1.4 test document" in body
+
+    def test_gives_up_after_three_retries(self, document):
+        processor, adapter = self._processor([503])
+
+        with mock.patch("docstrange.processors.cloud_processor.time.sleep"):
+            with pytest.raises(requests.HTTPError):
+                processor._post(document, "markdown")
+
+        assert len(adapter.bodies) == 4
+
+    def test_client_errors_are_not_retried(self, document):
+        processor, adapter = self._processor([400])
+
+        with pytest.raises(requests.HTTPError):
+            processor._post(document, "markdown")
+
+        assert len(adapter.bodies) == 1
@@ -0,0 +1,64 @@
+"""Tests for the DOCX processor."""
+
+import os
+import tempfile
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from docstrange.processors.docx_processor import DOCXProcessor
+
+
+class TestDOCXTables:
+    """Test cases for DOCX table extraction."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.processor = DOCXProcessor()
+
+    def _save(self, document):
+        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
+            temp_file = f.name
+        document.save(temp_file)
+        return temp_file
+
+    def test_merged_and_tabbed_cells(self):
+        """Cell text matches python-docx's cell.text for merged cells, tabs and breaks."""
+        document = docx.Document()
+        table = document.add_table(rows=3, cols=2)
+        table.cell(0, 0).text = "Name"
+        table.cell(0, 1).text = "Value"
+        merged = table.cell(1, 0).merge(table.cell(2, 0))
+        merged.text = "Merged"
+        table.cell(1, 1).text = "Tab\tbed"
+        table.cell(2, 1).text = "Line\nbreak"
+        temp_file = self._save(document)
+
+        try:
+            content = self.processor.process(temp_file).content
+
+            assert "| Name | Value |" in content
+            assert "| Merged | Tab bed |" in content
+            assert "| Merged | Line break |" in content
+        finally:
+            os.unlink(temp_file)
+
+    def test_matches_python_docx_cell_text(self):
+        """Every rendered cell equals python-docx's normalised cell text."""
+        document = docx.Document()
+        table = document.add_table(rows=2, cols=3)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = "Wide"
+        table.cell(0, 2).text = "a\tb"
+        table.cell(1, 0).text = "x"
+        table.cell(1, 1).text = "y"
+        table.cell(1, 2).text = "z"
+        temp_file = self._save(document)
+
+        try:
+            content = self.processor.process(temp_file).content
+            for row in docx.Document(temp_file).tables[0].rows:
+                cells = [' '.join(cell.text.split()) for cell in row.cells]
+                assert "| " + " | ".join(cells) + " |" in content
+        finally:
+            os.unlink(temp_file)
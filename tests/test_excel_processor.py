@@ -0,0 +1,58 @@
+"""Tests for the Excel/CSV processor."""
+
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from docstrange.processors.excel_processor import ExcelProcessor
+
+
+class TestCSVProcessing:
+    """Test cases for CSV to markdown conversion."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.processor = ExcelProcessor()
+
+    def _write_csv(self, text):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(text)
+            return f.name
+
+    def test_values_are_not_reformatted(self):
+        """Numbers and numeric-looking strings keep their original form."""
+        temp_file = self._write_csv("amount,ratio,code\n1234567.89,3.14159265,1e5\n10.5,2.0,abc\n")
+
+        try:
+            content = self.processor.process(temp_file).content
+
+            assert "| amount | ratio | code |" in content
+            assert "| --- | --- | --- |" in content
+            assert "| 1234567.89 | 3.14159265 | 1e5 |" in content
+            assert "1.23457e+06" not in content
+            assert "100000" not in content
+        finally:
+            os.unlink(temp_file)
+
+    def test_chunked_csv_matches_in_memory(self, monkeypatch):
+        """Oversized CSVs stream in chunks but render the same markdown."""
+        from docstrange.config import InternalConfig
+
+        rows = "\n".join(f"{i},item {i},{i * 1.5}" for i in range(7))
+        temp_file = self._write_csv(f"id,name,price\n{rows}\n")
+
+        try:
+            expected = self.processor.process(temp_file)
+
+            monkeypatch.setattr(InternalConfig, "csv_chunk_threshold", 0)
+            monkeypatch.setattr(InternalConfig, "csv_chunk_rows", 3)
+            chunked = self.processor.process(temp_file)
+
+            assert chunked.content == expected.content
+            assert chunked.metadata["row_count"] == expected.metadata["row_count"] == 7
+            assert chunked.metadata["columns"] == expected.metadata["columns"]
+        finally:
+            os.unlink(temp_file)
@@ -0,0 +1,49 @@
+"""Tests for the HTML processor's converters."""
+
+from unittest import mock
+
+import pytest
+
+from docstrange.processors.html_processor import HTMLProcessor
+
+HTML = "<html><body><h1>Quarterly Report</h1><p>Revenue grew <b>12%</b> this quarter.</p></body></html>"
+
+
+@pytest.fixture
+def html_file(tmp_path):
+    path = tmp_path / "report.html"
+    path.write_text(HTML, encoding="utf-8")
+    return str(path)
+
+
+class TestHTMLConversion:
+    """Test cases for choosing between markdownify and html2text."""
+
+    def test_html2text_branch(self, html_file):
+        pytest.importorskip("html2text")
+        processor = HTMLProcessor(use_markdownify=False)
+
+        with mock.patch.object(processor, "_convert_with_markdownify",
+                               side_effect=AssertionError("markdownify should not run")):
+            content = processor.process(html_file).content
+
+        assert "# Quarterly Report" in content
+        assert "Revenue grew **12%** this quarter." in content
+
+    def test_falls_back_to_markdownify_without_html2text(self, html_file):
+        processor = HTMLProcessor(use_markdownify=False)
+
+        with mock.patch.object(processor, "_convert_with_html2text", return_value=None), \
+                mock.patch.object(processor, "_convert_with_markdownify", return_value="converted") as markdownify:
+            assert processor.process(html_file).content == "converted"
+
+        markdownify.assert_called_once_with(HTML)
+
+    def test_extractor_passes_use_markdownify(self):
+        from docstrange import DocumentExtractor
+
+        extractor = DocumentExtractor(cpu=True, use_markdownify=False)
+        html_processors = [p for p in extractor.processors if isinstance(p, HTMLProcessor)]
+
+        assert html_processors
+        assert all(p.use_markdownify is False for p in html_processors)
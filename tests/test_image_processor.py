@@ -0,0 +1,122 @@
+"""Tests for batched image OCR and the shared OCR service."""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from docstrange.config import InternalConfig
+from docstrange.exceptions import ConversionError
+from docstrange.pipeline import ocr_service
+from docstrange.pipeline.ocr_service import OCRServiceFactory
+from docstrange.processors.image_processor import ImageProcessor
+
+
+class _StubOCRService:
+    """OCR service that echoes its inputs so ordering can be checked."""
+
+    def __init__(self):
+        self.batch_calls = []
+
+    def extract_text(self, image):
+        return f"text:{image}"
+
+    def extract_text_with_layout(self, image):
+        return f"layout:{image}"
+
+    def extract_text_with_layout_batch(self, images, batch_size=4):
+        self.batch_calls.append((list(images), batch_size))
+        return [f"layout:{image}" for image in images]
+
+
+@pytest.fixture
+def image_files(tmp_path):
+    paths = []
+    for name in ("c.png", "a.png", "b.png"):
+        path = tmp_path / name
+        path.write_bytes(b"not really a png")
+        paths.append(str(path))
+    return paths
+
+
+class TestImageProcessorBatch:
+    """Test cases for ImageProcessor.process_many and extract_texts."""
+
+    def test_process_many_keeps_input_order(self, image_files, monkeypatch):
+        monkeypatch.setattr(InternalConfig, "layout_ocr_enabled", True)
+        service = _StubOCRService()
+        processor = ImageProcessor(preserve_layout=True, ocr_service=service)
+
+        results = processor.process_many(image_files)
+
+        assert [result.content for result in results] == [f"layout:{path}" for path in image_files]
+        assert [result.metadata["file_path"] for result in results] == image_files
+        # All images go to the service in one batched call
+        assert service.batch_calls == [(image_files, InternalConfig.ocr_batch_size)]
+
+    def test_extract_texts_without_layout_uses_plain_ocr(self, image_files):
+        service = _StubOCRService()
+        processor = ImageProcessor(preserve_layout=False, ocr_service=service)
+
+        assert processor.extract_texts(image_files) == [f"text:{path}" for path in image_files]
+        assert service.batch_calls == []
+
+    def test_ocr_disabled_returns_empty_text_without_loading_models(self, image_files):
+        processor = ImageProcessor(ocr_enabled=False)
+
+        with mock.patch.object(OCRServiceFactory, "get_shared_service") as get_shared_service:
+            results = processor.process_many(image_files)
+
+        assert [result.content for result in results] == ["", "", ""]
+        get_shared_service.assert_not_called()
+
+    def test_process_many_rejects_missing_files(self, image_files):
+        processor = ImageProcessor(ocr_service=_StubOCRService())
+
+        with pytest.raises(ConversionError):
+            processor.process_many(image_files + ["/nonexistent/image.png"])
+
+
+class TestSharedOCRService:
+    """Test cases for OCRServiceFactory.get_shared_service."""
+
+    def test_service_is_created_once_across_threads(self, monkeypatch):
+        monkeypatch.setattr(ocr_service, "_shared_services", {})
+        created = []
+
+        def slow_create(provider=None):
+            # Widen the window in which racing threads could all miss the cache
+            time.sleep(0.05)
+            service = _StubOCRService()
+            created.append((provider, service))
+            return service
+
+        monkeypatch.setattr(OCRServiceFactory, "create_service", staticmethod(slow_create))
+
+        barrier = threading.Barrier(8)
+        services = []
+
+        def worker():
+            barrier.wait()
+            services.append(OCRServiceFactory.get_shared_service("Neural"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert created[0][0] == "neural"
+        assert all(service is created[0][1] for service in services)
+        assert OCRServiceFactory.get_shared_service("neural") is created[0][1]
+
+    def test_image_processor_uses_shared_service(self, monkeypatch):
+        service = _StubOCRService()
+        monkeypatch.setattr(ocr_service, "_shared_services", {"neural": service})
+
+        first = ImageProcessor(ocr_provider="neural")
+        second = ImageProcessor(ocr_provider="neural")
+
+        assert first._get_ocr_service() is second._get_ocr_service() is service
@@ -0,0 +1,34 @@
+"""Tests for layout-based markdown generation."""
+
+import pytest
+
+from docstrange.pipeline.layout_detector import LayoutDetector, LayoutElement
+
+
+def _to_markdown(text):
+    block = LayoutElement(text, x=10, y=10, width=200, height=20)
+    return LayoutDetector().convert_to_structured_markdown([block], (800, 600))
+
+
+@pytest.mark.parametrize("text", [
+    "3.5 million units sold",
+    "-5 degrees",
+    "e.g. this",
+])
+def test_prose_is_not_treated_as_list_item(text):
+    """Numbers, signs and abbreviations at the start of a line are kept as-is."""
+    assert _to_markdown(text) == text
+
+
+def test_lettered_prefix_keeps_its_text():
+    """A leading initial is never stripped from the paragraph."""
+    assert "A. Smith wrote" in _to_markdown("A. Smith wrote")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("- Buy milk", "- Buy milk"),
+    ("2. Second step", "- 2. Second step"),
+])
+def test_list_items_become_markdown_bullets(text, expected):
+    """Bullet markers are replaced by the markdown bullet; numbers are kept."""
+    assert _to_markdown(text) == expected
@@ -0,0 +1,80 @@
+"""Tests for the PDF processor's text-layer / OCR selection."""
+
+from unittest import mock
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PIL")
+
+from docstrange.config import InternalConfig
+from docstrange.processors.pdf_processor import PDFProcessor
+
+BODY_TEXT = "This page has a real text layer with more than enough characters to skip OCR."
+
+
+def _add_text_page(doc, text):
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+
+
+def _add_scanned_page(doc):
+    page = doc.new_page()
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), 0)
+    pix.clear_with(255)
+    page.insert_image(fitz.Rect(72, 72, 272, 272), pixmap=pix)
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setattr(InternalConfig, "pdf_to_image_enabled", False)
+    processor = PDFProcessor()
+    processor._image_processor.extract_texts = mock.MagicMock(
+        side_effect=lambda images: ["Scanned page text"] * len(images)
+    )
+    return processor
+
+
+def _save(doc, tmp_path):
+    path = str(tmp_path / "document.pdf")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestPDFTextLayer:
+    """Test cases for choosing between the text layer and OCR."""
+
+    def test_blank_and_short_pages_use_text_layer(self, processor, tmp_path):
+        doc = fitz.open()
+        _add_text_page(doc, BODY_TEXT)
+        doc.new_page()
+        _add_text_page(doc, "Page 3")
+        path = _save(doc, tmp_path)
+
+        result = processor.process(path)
+
+        assert result.metadata["extraction_method"] == "direct"
+        assert result.metadata["pages"] == 3
+        assert "more than enough characters" in result.content
+        assert "Page 3" in result.content
+        processor._image_processor.extract_texts.assert_not_called()
+
+    def test_scanned_pages_are_ocrd_alongside_text_layer(self, processor, tmp_path):
+        doc = fitz.open()
+        _add_text_page(doc, BODY_TEXT)
+        _add_scanned_page(doc)
+        doc.new_page()
+        path = _save(doc, tmp_path)
+
+        result = processor.process(path)
+
+        assert result.metadata["extraction_method"] == "hybrid"
+        assert result.metadata["pages"] == 3
+        assert "## Page 1" in result.content
+        assert "more than enough characters" in result.content
+        assert "## Page 2\n\nScanned page text" in result.content
+        assert "## Page 3" not in result.content
+        # Only the scanned page is rendered and OCR'd
+        processor._image_processor.extract_texts.assert_called_once()
+        assert len(processor._image_processor.extract_texts.call_args[0][0]) == 1